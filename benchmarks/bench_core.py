@@ -0,0 +1,241 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+#Allowing the benchmarks to import the game package from src/, like the GUI does.
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from game.card import BingoCard
+from game.draw import NumberDrawer
+from game.engine import play_game
+
+#Importing the array-backed hall, which needs NumPy; its benchmarks are skipped without it.
+try:
+    from game.hall import CardHall
+except ImportError:
+    CardHall = None
+
+#Defining the default parameters of a run.
+DEFAULT_SIZES = (4, 5)
+DEFAULT_RANGES = (99, 999)
+DEFAULT_HALLS = (1_000, 10_000)
+
+
+#Defining a helper function that times one benchmark. run() returns how many operations it did, or
+#(operations, seconds) when it times itself to leave its setup out.
+def measure(run, repeat: int = 5, min_time: float = 0.05):
+    """Times run() and returns the best seconds per operation over `repeat` rounds."""
+    best = float("inf")
+    for _ in range(repeat):
+        #Calling the benchmark until the round is long enough to time reliably.
+        ops = timed = 0
+        while not ops or timed < min_time:
+            start = time.perf_counter()
+            done = run()
+            elapsed = time.perf_counter() - start
+            #Using the benchmark's own timing when it reports one.
+            if isinstance(done, tuple):
+                done, elapsed = done
+            ops += done
+            timed += elapsed
+        best = min(best, timed / ops)
+    return best
+
+
+#Defining the benchmarks of the card, each returning a function that does some operations and counts them.
+def bench_generate(size: int, number_range: int):
+    def run():
+        BingoCard(size, number_range)
+        return 1
+    return run
+
+
+def bench_mark_number(size: int, number_range: int):
+    def run():
+        #Marking every number of a fresh card (the card creation is setup, left out of the timing).
+        card = BingoCard(size, number_range)
+        numbers = card.get_card_numbers()
+        start = time.perf_counter()
+        for number in numbers:
+            card.mark_number(number)
+        #Marking numbers that are not on the card too, which is the common case in a game.
+        for number in range(1, number_range + 1, 7):
+            card.mark_number(number)
+        return len(numbers) + len(range(1, number_range + 1, 7)), time.perf_counter() - start
+    return run
+
+
+def bench_check_line(size: int, number_range: int):
+    #Creating a card with one complete row; the first call announces it, the rest time the usual "nothing new" check.
+    card = BingoCard(size, number_range)
+    for number in card.grid[0]:
+        card.mark_number(number)
+
+    def run():
+        for _ in range(1000):
+            card.check_line()
+        return 1000
+    return run
+
+
+def bench_check_bingo(size: int, number_range: int):
+    card = BingoCard(size, number_range)
+
+    def run():
+        for _ in range(1000):
+            card.check_bingo()
+        return 1000
+    return run
+
+
+def bench_draw_number(size: int, number_range: int):
+    def run():
+        #Drawing every number of a fresh drawer.
+        drawer = NumberDrawer(number_range)
+        for _ in range(number_range):
+            drawer.draw_number()
+        return number_range
+    return run
+
+
+def bench_full_game(size: int, number_range: int):
+    def run():
+        #Playing a game until every number is drawn or the card is complete.
+        play_game(number_range, BingoCard(size, number_range), NumberDrawer(number_range))
+        return 1
+    return run
+
+
+#Defining the benchmarks of a hall of cards.
+def bench_hall_draw(n_cards: int):
+    def run():
+        #Drawing every number on a fresh hall (reported per draw, the hall creation is left out).
+        hall = CardHall(n_cards)
+        start = time.perf_counter()
+        for number in range(1, hall.number_range + 1):
+            hall.draw(number)
+        return hall.number_range, time.perf_counter() - start
+    return run
+
+
+def bench_hall_resolve(n_cards: int):
+    hall = CardHall(n_cards)
+    draws = list(range(1, hall.number_range + 1))
+
+    def run():
+        hall.resolve(draws)
+        return 1
+    return run
+
+
+#Defining a function that runs every benchmark for the given parameters.
+def run_benchmarks(sizes=DEFAULT_SIZES, ranges=DEFAULT_RANGES, halls=DEFAULT_HALLS, repeat: int = 5, min_time: float = 0.05):
+    """Returns {benchmark name: {"params": ..., "seconds_per_op": ...}} for every parameter combination."""
+    results = {}
+    #Running the card benchmarks for every card size and number range.
+    card_benchmarks = {
+        "generate": bench_generate, "mark_number": bench_mark_number, "check_line": bench_check_line,
+        "check_bingo": bench_check_bingo, "draw_number": bench_draw_number, "full_game": bench_full_game,
+    }
+    for size in sizes:
+        for number_range in ranges:
+            #Skipping cards with more cells than numbers.
+            if size * size > number_range:
+                continue
+            for name, bench in card_benchmarks.items():
+                params = {"size": size, "number_range": number_range}
+                results[f"{name}[size={size},range={number_range}]"] = {
+                    "params": params, "seconds_per_op": measure(bench(size, number_range), repeat, min_time),
+                }
+    #Running the hall benchmarks for every hall size, when NumPy is available.
+    if CardHall is not None:
+        for n_cards in halls:
+            for name, bench in (("hall_draw", bench_hall_draw), ("hall_resolve", bench_hall_resolve)):
+                results[f"{name}[cards={n_cards}]"] = {
+                    "params": {"cards": n_cards}, "seconds_per_op": measure(bench(n_cards), repeat, min_time),
+                }
+    return results
+
+
+#Defining a function that compares results with a baseline.
+def compare(results, baseline, threshold: float = 0.10):
+    """Returns (name, baseline, current, ratio, regressed) for every benchmark found in both runs."""
+    rows = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, now = baseline[name]["seconds_per_op"], result["seconds_per_op"]
+        ratio = now / before if before else float("inf")
+        rows.append((name, before, now, ratio, ratio > 1 + threshold))
+    return rows
+
+
+#Defining a helper function formatting a duration with a readable unit.
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+#Defining a function that reads the command line options.
+def parse_args(argv=None):
+    """Parse the command line options of the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Benchmarks of the Mini Bingo game core.")
+    #Adding the options choosing the parameters of the benchmarks.
+    parser.add_argument("--sizes", type=lambda s: [int(v) for v in s.split(",")], default=list(DEFAULT_SIZES), help="card sizes, e.g. 4,5,10")
+    parser.add_argument("--ranges", type=lambda s: [int(v) for v in s.split(",")], default=list(DEFAULT_RANGES), help="number ranges, e.g. 99,999")
+    parser.add_argument("--halls", type=lambda s: [int(v) for v in s.split(",") if v], default=list(DEFAULT_HALLS), help="hall sizes (cards), e.g. 1000,10000")
+    #Adding the options controlling the timing.
+    parser.add_argument("--repeat", type=int, default=5, help="timed rounds per benchmark (the best one is kept)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum duration of a timed round (seconds)")
+    #Adding the options for the JSON output and the baseline comparison.
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON to PATH ('-' for stdout)")
+    parser.add_argument("--baseline", metavar="PATH", help="compare with the results stored in PATH")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown that counts as a regression (0.10 = 10%%)")
+    return parser.parse_args(argv)
+
+
+#Defining the main function of the benchmark suite.
+def main(argv=None):
+    """Runs the benchmarks, prints them, and returns 1 if any regressed beyond the threshold."""
+    args = parse_args(argv)
+    results = run_benchmarks(args.sizes, args.ranges, args.halls, args.repeat, args.min_time)
+    #Writing the machine-readable results.
+    report = {
+        "meta": {
+            "python": platform.python_version(), "platform": platform.platform(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+    if args.json == "-":
+        print(json.dumps(report, indent=2))
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    #Printing the results, compared with the baseline when one is given.
+    out = sys.stderr if args.json == "-" else sys.stdout
+    if not args.baseline:
+        for name, result in results.items():
+            print(f"{name:<40} {format_time(result['seconds_per_op']):>12}", file=out)
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    rows = compare(results, baseline, args.threshold)
+    for name, before, now, ratio, regressed in rows:
+        print(f"{name:<40} {format_time(before):>12} -> {format_time(now):>12}  x{ratio:.2f}{'  REGRESSION' if regressed else ''}", file=out)
+    regressions = [row for row in rows if row[4]]
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%} out of {len(rows)} benchmarks", file=out)
+    return 1 if regressions else 0
+
+
+#Ensuring this block only runs if this file is executed directly.
+if __name__ == "__main__":
+    sys.exit(main())
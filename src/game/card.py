@@ -1,35 +1,192 @@
 import random
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+#Defining a class named MarkEvent as a dataclass, describing what marking a number did to a card.
+@dataclass
+class MarkEvent:
+    """Result of BingoCard.mark(): where the number was marked, how many lines it completed, and the bingo."""
+    #Storing the number that was marked.
+    number: int
+    #Storing the (row, column) of the number, or None if it is not on the card.
+    cell: Optional[Tuple[int, int]] = None
+    #Storing how many lines (rows, columns or diagonals) this mark completed.
+    new_lines: int = 0
+    #Storing whether this mark completed the whole card.
+    bingo: bool = False
+
+    #Defining a property telling whether the number was found on the card.
+    @property
+    def marked(self) -> bool:
+        return self.cell is not None
+
+
+#Defining a helper base class for the marked rows and matrix, whose length is fixed by the card size.
+class _FixedSizeList(list):
+    """A list whose cells can be reassigned but whose length cannot change."""
+
+    __slots__ = ()
+
+    #Defining every list method that would add or remove cells, refusing the call (the counters could not follow).
+    def _resize(self, *args, **kwargs):
+        raise TypeError("the marked cells of a card have a fixed size; assign cells instead")
+
+    append = extend = insert = pop = remove = clear = __delitem__ = __iadd__ = __imul__ = _resize
+
+    #Defining a helper method that checks a slice assignment keeps the length.
+    def _check_slice(self, index: slice, values) -> list:
+        values = list(values)
+        if len(range(*index.indices(len(self)))) != len(values):
+            self._resize()
+        return values
+
+
+#Defining a helper class for one row of the marked matrix, which reports every change back to its card.
+class _MarkedRow(_FixedSizeList):
+    """A row of marks that keeps the owning card's line counters in sync."""
+
+    __slots__ = ("_card", "_row")
+
+    #Defining the constructor, storing the owning card and the row index.
+    def __init__(self, values, card, row):
+        super().__init__(values)
+        self._card = card
+        self._row = row
+
+    #Defining how the row is pickled and copied (rebuilt whole, since its resizing methods are refused).
+    def __reduce__(self):
+        return _MarkedRow, (list(self), self._card, self._row)
+
+    #Defining how a cell is assigned, so that direct writes like marked[i][j] = True are counted.
+    def __setitem__(self, index, value):
+        #Slice assignments can change several cells at once, so the card recounts everything.
+        if isinstance(index, slice):
+            super().__setitem__(index, self._check_slice(index, value))
+            self._card._recount()
+            return
+        #Remembering the previous state of the cell before overwriting it.
+        was_marked = bool(self[index])
+        super().__setitem__(index, value)
+        #Updating the counters only when the cell actually changed state.
+        if was_marked != bool(value):
+            self._card._count_cell(self._row, index % len(self), 1 if value else -1)
+
+
+#Defining a helper class for the whole marked matrix, which re-wraps rows assigned into it.
+class _MarkedGrid(_FixedSizeList):
+    """The marked matrix of a card; replacing a row recounts the card."""
+
+    __slots__ = ("_card",)
+
+    #Defining the constructor, wrapping every row so that cell writes are tracked.
+    def __init__(self, rows, card):
+        super().__init__(_MarkedRow(row, card, i) for i, row in enumerate(rows))
+        self._card = card
+
+    #Defining how the matrix is pickled and copied (rebuilt whole, since its resizing methods are refused).
+    def __reduce__(self):
+        return _MarkedGrid, ([list(row) for row in self], self._card)
+
+    #Defining how a full row is assigned, e.g. marked[0] = [True, True, True, True].
+    def __setitem__(self, index, row):
+        #Assigning a slice of rows row by row, as long as it keeps the number of rows.
+        if isinstance(index, slice):
+            rows = self._check_slice(index, row)
+            indices = range(*index.indices(len(self)))
+            super().__setitem__(index, [_MarkedRow(r, self._card, i) for i, r in zip(indices, rows)])
+        else:
+            super().__setitem__(index, _MarkedRow(row, self._card, index % len(self)))
+        self._card._recount()
+
 
 #Defining a class named BingoCard, which represents a single bingo card.
 class BingoCard:
     """Represents a 4x4 Bingo card with unique random numbers."""
 
-    #Defining the constructor, including parameters for card size and maximum number.
-    def __init__(self, size: int = 4, number_range: int = 99):
+    #Defining the constructor, including parameters for card size, maximum number and an optional random generator.
+    def __init__(self, size: int = 4, number_range: int = 99, rng: random.Random = None):
         #Storing the size of the bingo card: 4x4.
         self.size = size
+        #Storing the random generator used to pick the numbers (None uses the shared module generator,
+        #so the card stays picklable).
+        self.rng = rng
         #Storing the maximum number that can appear on the card.
         self.number_range = number_range
+        #Creating the index mapping each number on the card to its (row, column) position.
+        #It is filled in by _generate_card(), so every lookup afterwards is a single dictionary access.
+        self.positions = {}
         #Generating the bingo card grid, using the method _generate_card().
         self.grid = self._generate_card()
-        #Creating a matrix of the same size as the card (4x4) to track whether each cell has been marked.
-        #All cells are initialized as False.
-        self.marked = [[False for _ in range(self.size)] for _ in range(self.size)]
         #Initializing a list tracking whether each row has already been declared a completed line.
         #To prevent repeated messages.
         self.line_rows_announced = [False] * self.size
         #Initializing a list tracking whether each column has already been declared a completed line.
         #To prevent repeated messages.
         self.line_cols_announced = [False] * self.size
+        #Creating a matrix of the same size as the card (4x4) to track whether each cell has been marked.
+        #All cells are initialized as False. Assigning it also resets the counters below.
+        self.marked = [[False for _ in range(self.size)] for _ in range(self.size)]
+
+    #Defining the marked matrix as a property, so that assigning a new matrix keeps the counters valid.
+    @property
+    def marked(self):
+        """Matrix of booleans telling which cells have been marked."""
+        return self._marked
+
+    @marked.setter
+    def marked(self, rows):
+        #Wrapping the rows so that every later cell write updates the counters.
+        self._marked = _MarkedGrid(rows, self)
+        #Rebuilding the counters from the new matrix.
+        self._recount()
+
+    #Defining a helper method that rebuilds every counter from the marked matrix.
+    def _recount(self):
+        """Recomputes the row, column and total mark counters from scratch."""
+        #Counting the marked cells of each row.
+        self.row_counts = [sum(1 for cell in row if cell) for row in self._marked]
+        #Counting the marked cells of each column.
+        self.col_counts = [sum(1 for row in self._marked if row[j]) for j in range(self.size)]
+        #Counting every marked cell on the card.
+        self.marked_count = sum(self.row_counts)
+        #Queueing every complete line that has not been announced yet (rows first, then columns).
+        self._pending_lines = deque(
+            [("row", i) for i, count in enumerate(self.row_counts) if count == self.size]
+            + [("col", j) for j, count in enumerate(self.col_counts) if count == self.size]
+        )
+
+    #Defining a helper method that updates the counters after a single cell changed.
+    def _count_cell(self, i: int, j: int, delta: int):
+        """Adds delta to the counters of row i and column j, queueing lines that became complete."""
+        #Updating the counters of the row, the column and the whole card.
+        self.row_counts[i] += delta
+        self.col_counts[j] += delta
+        self.marked_count += delta
+        #Queueing the row if this cell completed it.
+        if self.row_counts[i] == self.size:
+            self._pending_lines.append(("row", i))
+        #Queueing the column if this cell completed it.
+        if self.col_counts[j] == self.size:
+            self._pending_lines.append(("col", j))
 
     #Defining a helper method that creates the card. 
     def _generate_card(self):
         """Generates a grid of unique random numbers between 1–99."""
         #Randomly selecting 4x4 (size) unique numbers within the allowed range.
-        numbers = random.sample(range(1, self.number_range + 1), self.size ** 2)
+        numbers = (self.rng or random).sample(range(1, self.number_range + 1), self.size ** 2)
+        #Building the position index once: the k-th sampled number lives at row k // size, column k % size.
+        self.positions = {num: divmod(k, self.size) for k, num in enumerate(numbers)}
         #Slicing the list of elements to form a matrix of size 4x4 (grid).
         return [numbers[i:i + self.size] for i in range(0, len(numbers), self.size)]
 
+    #Defining a method to look up where a number sits on the card.
+    def find_number(self, number: int):
+        """Returns the (row, column) of the number on the card, or None if it is not present."""
+        #Looking the number up in the position index instead of scanning the grid.
+        return self.positions.get(number)
+
     #Defining a method to validate the card created.
     def validate_card(self) -> bool:
         """Validates that the card contains 16 unique numbers within range."""
@@ -51,18 +208,33 @@ class BingoCard:
     def mark_number(self, number: int) -> bool:
         """Marks the number on the card if found. 
         Returns True if the number was present and marked, False otherwise. """
-        #Creating a loop through each row.
-        for i in range(self.size):
-            #Creating a loop through each column (within the row).
-            for j in range(self.size):
-                #Checking if the current cell matches the number.
-                if self.grid[i][j] == number:
-                    #If the current cell matches the number, marking it as True.
-                    self.marked[i][j] = True
-                    #Returning True if the number was marked and found.
-                    return True
+        #Looking up the cell holding the number in the position index.
+        position = self.find_number(number)
         #Returning False if the number was not found, therefore not marked. 
-        return False
+        if position is None:
+            return False
+        #Unpacking the row and column of the matching cell.
+        i, j = position
+        #Marking the matching cell as True (the row updates the row, column and total counters).
+        self.marked[i][j] = True
+        #Returning True if the number was marked and found.
+        return True
+
+    #Defining a method that marks a number and reports everything it changed (every front end goes through it).
+    def mark(self, number: int) -> MarkEvent:
+        """Marks the number and returns a MarkEvent with its cell, the lines it completed and the bingo."""
+        #Creating the event of a number that is not on the card.
+        event = MarkEvent(number, self.find_number(number))
+        #Returning it as is if the number is not on the card, or was already marked.
+        if event.cell is None or self.marked[event.cell[0]][event.cell[1]]:
+            return event
+        #Marking the cell and announcing every line it completed (a corner cell can complete a row and a column).
+        self.mark_number(number)
+        while self.check_line():
+            event.new_lines += 1
+        #Checking if this mark completed the card.
+        event.bingo = self.check_bingo()
+        return event
 
     #Defining a method to show the card on the screen.        
     def display_card(self):
@@ -95,29 +267,240 @@ class BingoCard:
     #Defining a method to check if any full row or column has been completed (all numbers marked).
     def check_line(self) -> bool:
         """Checks if any row or column is fully marked (a 'Line')."""
-        #Creating a loop through each row and each number in it. 
-        for i, row in enumerate(self.marked):
-            #Checking if the row is fully marked, and if it hasn't been announced already.
-            if all(row) and not self.line_rows_announced[i]:
-                #In this case, marking the row as announced.
-                self.line_rows_announced[i] = True
+        #Taking the lines completed since the last check, in the order they were completed.
+        while self._pending_lines:
+            kind, index = self._pending_lines.popleft()
+            #Choosing the counters and announcements matching the kind of line.
+            if kind == "row":
+                counts, announced = self.row_counts, self.line_rows_announced
+            else:
+                counts, announced = self.col_counts, self.line_cols_announced
+            #Checking if the line is still fully marked, and if it hasn't been announced already.
+            if counts[index] == self.size and not announced[index]:
+                #In this case, marking the line as announced.
+                announced[index] = True
                 #Returning True because a new line was completed. 
                 return True
 
-        #Creating a loop through each column index. 
-        for j in range(self.size):
-            #Checking if the column is fully marked, and if it hasn't been announced already.
-            if all(self.marked[i][j] for i in range(self.size)) and not self.line_cols_announced[j]:
-                #In this case, marking the column as announced.
-                self.line_cols_announced[j] = True
-                #Returning True because a new line was completed.
-                return True
-
         #Returning False is no new row or columns has been completed. 
         return False
 
     #Defining a method to check if the entire card has been completed (all number marked).
     def check_bingo(self) -> bool:
         """Checks if the entire card is marked (a 'Bingo')."""
-        #Checking if every cell in the grid is marked. And returning True if the entire card is completed. 
-        return all(all(row) for row in self.marked)
+        #Comparing the total number of marked cells with the number of cells. And returning True if the entire card is completed. 
+        return self.marked_count == self.size ** 2
+
+
+#Defining a helper class that shows one row of a bitmask card as if it were a list of booleans.
+class _MaskRowView:
+    """List-like view of one row of a CompactBingoCard's mark bitmask."""
+
+    __slots__ = ("_card", "_row")
+
+    #Defining the constructor, storing the card and the row index.
+    def __init__(self, card, row):
+        self._card = card
+        self._row = row
+
+    def __len__(self):
+        return self._card.size
+
+    #Defining how a cell (or a slice of cells) is read from the bitmask.
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[j] for j in range(self._card.size)[index]]
+        return bool(self._card.mask >> self._card._bit(self._row, index % self._card.size) & 1)
+
+    #Defining how a cell is written into the bitmask.
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            for j, cell in zip(range(self._card.size)[index], value):
+                self._card._set_cell(self._row, j, cell)
+            return
+        self._card._set_cell(self._row, index % self._card.size, value)
+
+    def __iter__(self):
+        return (self[j] for j in range(self._card.size))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    #Defining a method returning a plain list copy of the row, like list.copy().
+    def copy(self):
+        return list(self)
+
+
+#Defining a helper class that shows a whole bitmask card as if it were a matrix of booleans.
+class _MaskGridView:
+    """List-of-lists-like view of a CompactBingoCard's mark bitmask."""
+
+    __slots__ = ("_card",)
+
+    #Defining the constructor, storing the card.
+    def __init__(self, card):
+        self._card = card
+
+    def __len__(self):
+        return self._card.size
+
+    #Defining how a row view is read.
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(self._card.size)[index]]
+        return _MaskRowView(self._card, index % self._card.size)
+
+    #Defining how a full row is written, e.g. marked[0] = [True, True, True, True].
+    def __setitem__(self, index, row):
+        for j, cell in enumerate(row):
+            self._card._set_cell(index % self._card.size, j, cell)
+
+    def __iter__(self):
+        return (self[i] for i in range(self._card.size))
+
+    def __eq__(self, other):
+        return [list(row) for row in self] == [list(row) for row in other]
+
+    def __repr__(self):
+        return repr([list(row) for row in self])
+
+
+#Defining a class named CompactBingoCard, a bingo card whose marks are stored as a single integer.
+class CompactBingoCard(BingoCard):
+    """Bingo card storing its marks in one integer bitmask, with every winning line precompiled as a mask."""
+
+    #Defining the constructor, including the option to also count the two diagonals as lines.
+    def __init__(self, size: int = 4, number_range: int = 99, diagonals: bool = False, rng: random.Random = None):
+        #Storing whether diagonals count as winning lines.
+        self.diagonals = diagonals
+        #Initializing the bitmask of marked cells (bit row * size + column is set when the cell is marked).
+        self.mask = 0
+        #Initializing the bitmask of announced lines (bit k is set once line_masks[k] has been announced).
+        self.announced_mask = 0
+        #Storing the mask with every cell set, used to detect a bingo.
+        self.full_mask = (1 << size ** 2) - 1
+        #Precompiling the mask of every winning line, as (kind, index, mask) entries.
+        self.line_masks = self._build_line_masks(size, diagonals)
+        #Initializing the rest of the card (grid, position index and empty marks).
+        super().__init__(size, number_range, rng)
+
+    #Defining a helper method that precompiles the mask of every winning line.
+    @staticmethod
+    def _build_line_masks(size: int, diagonals: bool):
+        """Returns the (kind, index, mask) entry of every row, column and, optionally, diagonal."""
+        #Building the mask of the first row and of the first column.
+        row_mask = (1 << size) - 1
+        col_mask = sum(1 << (i * size) for i in range(size))
+        #Shifting them to get every row and every column.
+        lines = [("row", i, row_mask << (i * size)) for i in range(size)]
+        lines += [("col", j, col_mask << j) for j in range(size)]
+        #Adding both diagonals if they count as lines.
+        if diagonals:
+            lines.append(("diag", 0, sum(1 << (i * size + i) for i in range(size))))
+            lines.append(("diag", 1, sum(1 << (i * size + size - 1 - i) for i in range(size))))
+        return lines
+
+    #Defining a helper method returning the bit index of a cell.
+    def _bit(self, i: int, j: int) -> int:
+        return i * self.size + j
+
+    #Defining a helper method that sets or clears the bit of one cell.
+    def _set_cell(self, i: int, j: int, value):
+        if value:
+            self.mask |= 1 << self._bit(i, j)
+        else:
+            self.mask &= ~(1 << self._bit(i, j))
+
+    #Defining the marked matrix as a view over the bitmask, so existing callers keep working.
+    @property
+    def marked(self):
+        """Matrix-like view telling which cells have been marked."""
+        return _MaskGridView(self)
+
+    @marked.setter
+    def marked(self, rows):
+        #Rebuilding the bitmask from the given matrix of booleans.
+        self.mask = 0
+        for i, row in enumerate(rows):
+            for j, cell in enumerate(row):
+                self._set_cell(i, j, cell)
+
+    #Defining the announced rows as a list derived from the announced-lines bitmask.
+    @property
+    def line_rows_announced(self):
+        return self._announced("row")
+
+    @line_rows_announced.setter
+    def line_rows_announced(self, flags):
+        self._set_announced("row", flags)
+
+    #Defining the announced columns as a list derived from the announced-lines bitmask.
+    @property
+    def line_cols_announced(self):
+        return self._announced("col")
+
+    @line_cols_announced.setter
+    def line_cols_announced(self, flags):
+        self._set_announced("col", flags)
+
+    #Defining a helper method listing which lines of one kind have been announced.
+    def _announced(self, kind: str):
+        return [bool(self.announced_mask >> k & 1) for k, line in enumerate(self.line_masks) if line[0] == kind]
+
+    #Defining a helper method overwriting which lines of one kind have been announced.
+    def _set_announced(self, kind: str, flags):
+        positions = [k for k, line in enumerate(self.line_masks) if line[0] == kind]
+        for k, flag in zip(positions, flags):
+            if flag:
+                self.announced_mask |= 1 << k
+            else:
+                self.announced_mask &= ~(1 << k)
+
+    #Defining the number of marked cells as the number of set bits.
+    @property
+    def marked_count(self) -> int:
+        return bin(self.mask).count("1")
+
+    #Defining the per-row mark counters, counted from the row masks.
+    @property
+    def row_counts(self):
+        return [bin(self.mask & m).count("1") for kind, _, m in self.line_masks if kind == "row"]
+
+    #Defining the per-column mark counters, counted from the column masks.
+    @property
+    def col_counts(self):
+        return [bin(self.mask & m).count("1") for kind, _, m in self.line_masks if kind == "col"]
+
+    #Defining a method to mark a number if it is present on the card.
+    def mark_number(self, number: int) -> bool:
+        """Marks the number on the card if found. 
+        Returns True if the number was present and marked, False otherwise. """
+        #Looking up the cell holding the number in the position index.
+        position = self.find_number(number)
+        #Returning False if the number was not found, therefore not marked.
+        if position is None:
+            return False
+        #Setting the bit of the matching cell.
+        self.mask |= 1 << self._bit(*position)
+        return True
+
+    #Defining a method to check if any winning line has been completed.
+    def check_line(self) -> bool:
+        """Checks if any row or column (or diagonal, if enabled) is fully marked (a 'Line')."""
+        #Creating a loop through the precompiled line masks.
+        for k, (_, _, line_mask) in enumerate(self.line_masks):
+            #Checking if every cell of the line is marked, and if the line hasn't been announced already.
+            if self.mask & line_mask == line_mask and not self.announced_mask >> k & 1:
+                #In this case, marking the line as announced and reporting it.
+                self.announced_mask |= 1 << k
+                return True
+        #Returning False if no new line has been completed.
+        return False
+
+    #Defining a method to check if the entire card has been completed.
+    def check_bingo(self) -> bool:
+        """Checks if the entire card is marked (a 'Bingo')."""
+        return self.mask == self.full_mask
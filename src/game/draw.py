@@ -1,33 +1,77 @@
 import random
 
+#Above this range size, drawers default to the lazy mode, whose memory grows with the draws instead of the range.
+LAZY_THRESHOLD = 100_000
+
 #Defining a class named NumberDrawer, which draws unique random numbers. 
 class NumberDrawer:
     """Handles random number drawing from 1–99 without repetition."""
 
-    #Defining the constructor, including the parameter for maximum number (99).
-    def __init__(self, max_number: int = 99):
+    #Defining the constructor, including the parameter for maximum number (99), an optional random generator
+    #and the drawing mode (lazy=None picks the lazy mode automatically for ranges above LAZY_THRESHOLD).
+    def __init__(self, max_number: int = 99, rng: random.Random = None, lazy: bool = None):
         #Storing the maximum number that can be drawn.
         self.max_number = max_number
-        #Creating a set containing the numbers that have not been drawn yet.
-        #Initialized with every number from 1 to the maximum. 
-        self.available_numbers = set(range(1, max_number + 1))
+        #Storing the random generator used for draws (None uses the shared module generator when drawing,
+        #so the drawer stays picklable).
+        self.rng = rng
+        #Storing whether the drawer works without materializing the whole range.
+        self.lazy = max_number > LAZY_THRESHOLD if lazy is None else lazy
+        #Storing how many numbers are left to draw.
+        self.remaining = max_number
+        if self.lazy:
+            #Creating a sparse map describing a virtual array holding position + 1 at every position.
+            #Only positions touched by a draw are stored, so memory grows with the draws, not the range.
+            self._swaps = {}
+        else:
+            #Creating a set containing the numbers that have not been drawn yet.
+            #Initialized with every number from 1 to the maximum. 
+            self._available = set(range(1, max_number + 1))
+            #Creating an array with the same remaining numbers, so a random one can be picked by index.
+            #Drawn numbers are swapped to the end and popped, keeping every draw O(1).
+            self._pool = list(range(1, max_number + 1))
         #Initializing a list to keep track of the numbers that have already been drawn. 
         self.drawn_numbers = []
 
+    #Defining the set of numbers that have not been drawn yet.
+    @property
+    def available_numbers(self):
+        """Set of the numbers not drawn yet (built on demand in lazy mode, which costs O(max_number))."""
+        if self.lazy:
+            return set(range(1, self.max_number + 1)).difference(self.drawn_numbers)
+        return self._available
+
     #Defining a method to draw a new random number.
     def draw_number(self):
         """Draws a random number and removes it from the available pool."""
         #Checking if there are no numbers left to draw.
-        if not self.available_numbers:
+        if not self.remaining:
             #If there are none left, printing a message to tell the user that every number has been used.
             print(" All numbers have been drawn!")
             #Indicating that no new number could be drawn.
             return None
 
-        #Randomly selecting a number from the set of available numbers, by converting it to a list first.
-        number = random.choice(list(self.available_numbers))
-        #Removing the drawn number from the set of available numbers.
-        self.available_numbers.remove(number)
+        #Randomly selecting a position among the remaining numbers.
+        last = self.remaining - 1
+        index = (self.rng or random).randrange(self.remaining)
+        if self.lazy:
+            #Reading the chosen and the last positions of the virtual array (untouched positions hold position + 1).
+            swaps = self._swaps
+            number = swaps.get(index, index + 1)
+            tail = swaps.pop(last, last + 1)
+            #Moving the last number into the chosen position, unless the chosen position was the last one.
+            if index != last:
+                swaps[index] = tail
+        else:
+            #Moving the last number into the chosen position and taking the chosen number out (swap-remove).
+            pool = self._pool
+            number = pool[index]
+            pool[index] = pool[last]
+            pool.pop()
+            #Removing the drawn number from the set of available numbers.
+            self._available.remove(number)
+        #Counting the drawn number as no longer available.
+        self.remaining = last
         #Adding the drawn number to the set of already selected number.
         self.drawn_numbers.append(number)
         #Returning the drawn number.
@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from game.card import BingoCard, MarkEvent
+from game.draw import NumberDrawer
+
+#Defining the predefined game modes as (name, rounds) pairs, shared by the front ends and the simulator.
+GAME_MODES = (("Competitive", 30), ("Normal", 70), ("Easy", 99))
+
+
+#Defining a helper function returning the name of the mode with a given number of rounds.
+def mode_name(rounds: int) -> str:
+    """Returns the name of the predefined mode with this many rounds, or 'Custom'."""
+    return next((name for name, mode_rounds in GAME_MODES if mode_rounds == rounds), "Custom")
+
+#Defining a class named DrawOutcome as a dataclass, describing what happened in a single round.
+@dataclass
+class DrawOutcome(MarkEvent):
+    """Result of one draw: the MarkEvent of the drawn number, plus the round it was drawn in."""
+    #Storing the round in which the number was drawn (starting at 1).
+    round_number: int = 0
+
+
+#Defining a class named GameResult as a dataclass, summarizing a finished game.
+@dataclass
+class GameResult:
+    """Summary of a finished game: win flag, rounds used, lines completed and draw sequence."""
+    #Storing whether the player completed the card within the allowed rounds.
+    won: bool
+    #Storing the number of rounds allowed by the chosen mode.
+    max_rounds: int
+    #Storing the number of rounds actually played.
+    rounds_played: int
+    #Storing the total number of lines completed.
+    lines: int
+    #Storing the round of the first completed line, or None if no line was completed.
+    first_line_round: Optional[int] = None
+    #Storing the round of the bingo, or None if the card was not completed.
+    bingo_round: Optional[int] = None
+    #Storing every drawn number, in order.
+    draws: List[int] = field(default_factory=list)
+
+
+#Defining a class named GameEngine, which runs the rules of a game without any input or output.
+class GameEngine:
+    """Headless game loop connecting a card and a number drawer for a fixed number of rounds."""
+
+    #Defining the constructor, including the card, the drawer and the number of rounds.
+    def __init__(self, card: BingoCard = None, drawer: NumberDrawer = None, rounds: int = 99):
+        #Storing the card (a new random card by default).
+        self.card = card if card is not None else BingoCard()
+        #Storing the number drawer (a new drawer by default).
+        self.drawer = drawer if drawer is not None else NumberDrawer(self.card.number_range)
+        #Storing the number of rounds allowed.
+        self.rounds = rounds
+        #Initializing the number of rounds played so far.
+        self.current_round = 0
+        #Initializing the number of lines completed so far.
+        self.lines = 0
+        #Initializing the rounds of the first line and of the bingo (unknown until they happen).
+        self.first_line_round = None
+        self.bingo_round = None
+        #Creating a flag telling whether the drawer ran out of numbers.
+        self.exhausted = False
+
+    #Defining a property telling whether the game is over.
+    @property
+    def finished(self) -> bool:
+        """True once the card is complete, the rounds are used up, or no numbers are left."""
+        return self.bingo_round is not None or self.current_round >= self.rounds or self.exhausted
+
+    #Defining a method that plays a single round.
+    def step(self) -> Optional[DrawOutcome]:
+        """Draws one number, marks it and checks for lines and bingo. Returns None once the game is over."""
+        #Checking if the game has already finished.
+        if self.finished:
+            return None
+        #Drawing a number from the random pool.
+        number = self.drawer.draw_number()
+        #Checking if no number remains available.
+        if number is None:
+            self.exhausted = True
+            return None
+        #Counting the round.
+        self.current_round += 1
+        #Marking the number on the card, which reports the cell, the new lines and the bingo.
+        event = self.card.mark(number)
+        outcome = DrawOutcome(**vars(event), round_number=self.current_round)
+        #Recording the first completed line.
+        if event.new_lines:
+            self.lines += event.new_lines
+            if self.first_line_round is None:
+                self.first_line_round = self.current_round
+        #Recording the round of the bingo.
+        if event.bingo:
+            self.bingo_round = self.current_round
+        return outcome
+
+    #Defining a method that plays every remaining round.
+    def run(self) -> GameResult:
+        """Plays the game to the end and returns its result."""
+        while self.step() is not None:
+            pass
+        return self.result()
+
+    #Defining a method that summarizes the game so far.
+    def result(self) -> GameResult:
+        """Returns the result of the game (meaningful once finished)."""
+        return GameResult(
+            won=self.bingo_round is not None,
+            max_rounds=self.rounds,
+            rounds_played=self.current_round,
+            lines=self.lines,
+            first_line_round=self.first_line_round,
+            bingo_round=self.bingo_round,
+            draws=list(self.drawer.drawn_numbers),
+        )
+
+
+#Defining a helper function that plays a full game without any interaction.
+def play_game(rounds: int = 99, card: BingoCard = None, drawer: NumberDrawer = None) -> GameResult:
+    """Plays one headless game and returns its result."""
+    return GameEngine(card, drawer, rounds).run()
+
+
+#Defining a helper function that finds when a card wins for a known draw order, without replaying it.
+def win_rounds(card: BingoCard, draws: List[int]) -> Tuple[Optional[int], Optional[int]]:
+    """Returns (first_line_round, bingo_round) of the card for the given draw order (None if never reached)."""
+    #Resolving the card as a batch of one with the hall's vectorized rule (imported here, since it needs NumPy).
+    from game.hall import resolve_win_rounds
+    first_line, bingo = resolve_win_rounds(draws, [card])
+    return int(first_line[0]) or None, int(bingo[0]) or None
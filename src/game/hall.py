@@ -0,0 +1,254 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from game.card import BingoCard
+
+
+#Defining a class named HallDraw as a dataclass, describing what a single draw did to the whole hall.
+@dataclass
+class HallDraw:
+    """Effect of one draw on a hall: which cards were marked, completed lines, or completed bingo."""
+    #Storing the drawn number.
+    number: int
+    #Storing the indices of the cards holding the number.
+    marked_cards: np.ndarray
+    #Storing the indices of the cards that completed at least one new line, and how many each.
+    line_cards: np.ndarray
+    new_lines: np.ndarray
+    #Storing the indices of the cards that completed the bingo with this draw.
+    bingo_cards: np.ndarray
+
+
+#Defining a class named CardHall, which stores many cards as arrays instead of one object per card.
+class CardHall:
+    """A hall of bingo cards whose grids and marks live in shared NumPy arrays."""
+
+    #Defining the constructor, generating n_cards random cards.
+    def __init__(self, n_cards: int, size: int = 4, number_range: int = 99, seed=None, grids=None):
+        #Storing the size of every card and the maximum number.
+        self.size = size
+        self.number_range = number_range
+        #Creating the NumPy generator used to build the cards.
+        self.rng = np.random.default_rng(seed)
+        #Storing every grid in one (n_cards, size, size) array.
+        self.grids = self._generate_grids(n_cards) if grids is None else np.asarray(grids, dtype=np.int32)
+        self.n_cards = len(self.grids)
+        #Creating the marks of every cell of every card, all initialized as False.
+        self.marks = np.zeros(self.grids.shape, dtype=bool)
+        #Creating the announcement flags of every row and column of every card.
+        self.rows_announced = np.zeros((self.n_cards, size), dtype=bool)
+        self.cols_announced = np.zeros((self.n_cards, size), dtype=bool)
+        #Creating the number of lines completed and the bingo flag of every card.
+        self.lines = np.zeros(self.n_cards, dtype=np.int32)
+        self.bingo = np.zeros(self.n_cards, dtype=bool)
+        #Building the inverted index from every number to the cards and cells holding it.
+        self._build_index()
+
+    #Defining an alternative constructor that copies existing BingoCard objects into a hall.
+    @classmethod
+    def from_cards(cls, cards):
+        """Builds a hall holding the grids of the given cards (their marks are not copied)."""
+        cards = list(cards)
+        return cls(len(cards), cards[0].size, cards[0].number_range, grids=[card.grid for card in cards])
+
+    #Defining a helper method that creates every grid at once.
+    def _generate_grids(self, n_cards: int, budget: int = 64 * 2 ** 20) -> np.ndarray:
+        """Generates n_cards grids of unique numbers in 1..number_range, using about `budget` bytes at most."""
+        cells = self.size * self.size
+        grids = np.empty((n_cards, cells), dtype=np.int32)
+        #For ranges of at least cells**2 numbers, sampling each card's cells directly and redrawing the cards
+        #that got a repeated number (under half of them, so a few passes), with memory proportional to the cards.
+        if self.number_range >= cells * cells:
+            todo = np.arange(n_cards)
+            while todo.size:
+                sample = self.rng.integers(1, self.number_range + 1, (todo.size, cells))
+                repeated = (np.diff(np.sort(sample, axis=1), axis=1) == 0).any(axis=1)
+                grids[todo[~repeated]] = sample[~repeated]
+                todo = todo[repeated]
+            return grids.reshape(n_cards, self.size, self.size)
+        #For small ranges, ranking one random key per number, in chunks of cards whose keys fit in the budget.
+        chunk = max(1, budget // (8 * self.number_range))
+        for start in range(0, n_cards, chunk):
+            stop = min(start + chunk, n_cards)
+            #Sorting random keys gives an independent random permutation per card; its first cells are the card.
+            keys = self.rng.random((stop - start, self.number_range))
+            grids[start:stop] = np.argpartition(keys, cells - 1, axis=1)[:, :cells] + 1
+        return grids.reshape(n_cards, self.size, self.size)
+
+    #Defining a helper method that builds the inverted index of the hall.
+    def _build_index(self):
+        """Groups every (card, cell) of the hall by the number it holds."""
+        #Entries for number n are self._cells[self._offsets[n]:self._offsets[n + 1]], stored as flat positions
+        #card * size**2 + cell, so a draw only touches the cards holding the number.
+        flat = self.grids.reshape(-1)
+        #Sorting the flat positions by the number they hold (stable, so card order is kept per number).
+        self._cells = np.argsort(flat, kind="stable").astype(np.int64)
+        #Counting how many cells hold each number and turning the counts into start offsets.
+        counts = np.bincount(flat, minlength=self.number_range + 1)
+        self._offsets = np.zeros(self.number_range + 2, dtype=np.int64)
+        np.cumsum(counts, out=self._offsets[1:])
+
+    #Defining a method returning where a number appears in the hall.
+    def cells_for(self, number: int):
+        """Returns (card_ids, cell_ids) of every cell holding the number; cell_ids are row * size + column."""
+        #Returning empty arrays for numbers outside the range.
+        if not 1 <= number <= self.number_range:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        #Slicing the entries of this number out of the index.
+        entries = self._cells[self._offsets[number]:self._offsets[number + 1]]
+        return np.divmod(entries, self.size * self.size)
+
+    def __len__(self):
+        return self.n_cards
+
+    #Defining a method that marks a drawn number on every card and detects lines and bingos.
+    def draw(self, number: int) -> HallDraw:
+        """Marks the number on every card holding it and returns the cards that hit, lined or completed."""
+        #Looking up the cards and cells holding the number in the inverted index (a card holds it at most once).
+        marked_cards, cells = self.cells_for(number)
+        #Marking those cells only; no other card can have completed anything.
+        self.marks.reshape(self.n_cards, -1)[marked_cards, cells] = True
+        marks = self.marks[marked_cards]
+        #Finding the rows and columns of those cards that are now complete but have not been announced yet.
+        new_rows = marks.all(axis=2) & ~self.rows_announced[marked_cards]
+        new_cols = marks.all(axis=1) & ~self.cols_announced[marked_cards]
+        self.rows_announced[marked_cards] |= new_rows
+        self.cols_announced[marked_cards] |= new_cols
+        #Counting the new lines of every card holding the number.
+        new_lines = new_rows.sum(axis=1) + new_cols.sum(axis=1)
+        self.lines[marked_cards] += new_lines
+        lined = np.flatnonzero(new_lines)
+        #Finding the cards whose every cell is now marked for the first time.
+        complete = marks.all(axis=(1, 2)) & ~self.bingo[marked_cards]
+        bingo_cards = marked_cards[complete]
+        self.bingo[bingo_cards] = True
+        return HallDraw(number, marked_cards, marked_cards[lined], new_lines[lined], bingo_cards)
+
+    #Defining a method that finds every card's winning rounds for a known draw order.
+    def resolve(self, draws):
+        """Returns (first_line_rounds, bingo_rounds) of every card for the draw order, without replaying it."""
+        return resolve_win_rounds(draws, self.grids)
+
+    #Defining a method returning a single card of the hall as a BingoCard.
+    def card(self, index: int) -> "HallCardView":
+        """Returns a BingoCard view of one card; its marks are read from and written to the hall."""
+        return HallCardView(self, index)
+
+
+#Defining a class named HallCardView, a BingoCard backed by one slot of a CardHall.
+class HallCardView(BingoCard):
+    """BingoCard whose marks and announcements are views into a CardHall's arrays."""
+
+    #Defining the constructor, binding the view to a card of the hall (no new numbers are generated).
+    def __init__(self, hall: CardHall, index: int):
+        #Storing the hall and the index of the card.
+        self.hall = hall
+        self.index = index
+        #Storing the card size and number range of the hall.
+        self.size = hall.size
+        self.number_range = hall.number_range
+        #Copying the grid as Python integers and indexing the position of every number.
+        self.grid = hall.grids[index].tolist()
+        self.positions = {num: (i, j) for i, row in enumerate(self.grid) for j, num in enumerate(row)}
+
+    #Defining the marked matrix as the hall's slice for this card, so writes reach the hall.
+    @property
+    def marked(self):
+        return self.hall.marks[self.index]
+
+    @marked.setter
+    def marked(self, rows):
+        self.hall.marks[self.index] = rows
+
+    #Defining the announced rows and columns as the hall's slices for this card.
+    @property
+    def line_rows_announced(self):
+        return self.hall.rows_announced[self.index]
+
+    @property
+    def line_cols_announced(self):
+        return self.hall.cols_announced[self.index]
+
+    #Defining the counters as sums over the hall's slice.
+    @property
+    def row_counts(self):
+        return self.marked.sum(axis=1).tolist()
+
+    @property
+    def col_counts(self):
+        return self.marked.sum(axis=0).tolist()
+
+    @property
+    def marked_count(self) -> int:
+        return int(self.marked.sum())
+
+    #Defining a method to mark a number if it is present on the card.
+    def mark_number(self, number: int) -> bool:
+        """Marks the number on the card if found.
+        Returns True if the number was present and marked, False otherwise. """
+        #Looking up the cell holding the number in the position index.
+        position = self.find_number(number)
+        #Returning False if the number was not found, therefore not marked.
+        if position is None:
+            return False
+        #Marking the matching cell directly in the hall's array.
+        self.hall.marks[(self.index,) + position] = True
+        return True
+
+    #Defining a method to check if any full row or column has been completed.
+    def check_line(self) -> bool:
+        """Checks if any row or column is fully marked (a 'Line')."""
+        #Checking the rows first, then the columns, announcing the first new one.
+        for done, announced in ((self.marked.all(axis=1), self.line_rows_announced),
+                                (self.marked.all(axis=0), self.line_cols_announced)):
+            new = np.flatnonzero(done & ~announced)
+            if new.size:
+                #Announcing the line in the hall and counting it there, like draw() does.
+                announced[new[0]] = True
+                self.hall.lines[self.index] += 1
+                return True
+        return False
+
+    #Defining a method to check if the entire card has been completed.
+    def check_bingo(self) -> bool:
+        """Checks if the entire card is marked (a 'Bingo')."""
+        #Checking if every cell of this card's slice is marked, and recording the bingo in the hall.
+        complete = bool(self.marked.all())
+        if complete:
+            self.hall.bingo[self.index] = True
+        return complete
+
+
+#Defining a function that finds, in one vectorized pass, when each card of a batch wins for a draw order.
+def resolve_win_rounds(draws, cards):
+    """Returns (first_line_rounds, bingo_rounds) arrays of the cards for a draw order (rounds from 1, 0 = never)."""
+    #Stacking the cards, a (n_cards, size, size) array or any iterable of BingoCard objects or grids, into an array.
+    if not isinstance(cards, np.ndarray):
+        cards = [getattr(card, "grid", card) for card in cards]
+    grids = np.asarray(cards, dtype=np.int64)
+    draws = np.asarray(draws, dtype=np.int64).reshape(-1)
+    if not grids.size:
+        empty = np.zeros(len(grids), dtype=np.int64)
+        return empty, empty.copy()
+    #Looking up the round of every cell with a binary search in the sorted draws (no table over the number range,
+    #so any number works); numbers never drawn get a round past the end.
+    never = len(draws) + 1
+    order = np.argsort(draws, kind="stable")
+    sorted_draws = draws[order]
+    found = np.minimum(np.searchsorted(sorted_draws, grids), max(len(draws) - 1, 0))
+    if len(draws):
+        rounds = np.where(sorted_draws[found] == grids, order[found] + 1, never)
+    else:
+        rounds = np.full(grids.shape, never, dtype=np.int64)
+    #A line is complete at its latest cell; the first line is the earliest of the rows and columns.
+    row_done = rounds.max(axis=2).min(axis=1)
+    col_done = rounds.max(axis=1).min(axis=1)
+    first_line = np.minimum(row_done, col_done)
+    #The bingo happens at the latest cell of the card.
+    bingo = rounds.max(axis=(1, 2))
+    #Reporting rounds past the end of the draws as 0 (never).
+    first_line[first_line == never] = 0
+    bingo[bingo == never] = 0
+    return first_line, bingo
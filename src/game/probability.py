@@ -0,0 +1,56 @@
+from fractions import Fraction
+from functools import lru_cache
+from math import comb
+
+
+#Defining a helper function with the chance that a given set of numbers has all been drawn.
+@lru_cache(maxsize=None)
+def _all_drawn(cells: int, number_range: int, rounds: int) -> Fraction:
+    """Probability that `cells` specific numbers are all among the first `rounds` draws from 1..number_range."""
+    #Returning 0 when there are fewer draws than numbers to collect.
+    if rounds < cells:
+        return Fraction(0)
+    #Counting the draw sets that contain every one of the numbers, over every possible draw set.
+    return Fraction(comb(number_range - cells, rounds - cells), comb(number_range, rounds))
+
+
+#Defining a function with the exact chance of a bingo within a number of rounds.
+@lru_cache(maxsize=4096)
+def bingo_probability(rounds: int, size: int = 4, number_range: int = 99) -> Fraction:
+    """Exact probability that a size x size card is complete within `rounds` draws."""
+    #A bingo needs every number of the card to be drawn.
+    return _all_drawn(size * size, number_range, min(rounds, number_range))
+
+
+#Defining a function with the exact chance of at least one line within a number of rounds.
+@lru_cache(maxsize=4096)
+def line_probability(rounds: int, size: int = 4, number_range: int = 99) -> Fraction:
+    """Exact probability that at least one row or column is complete within `rounds` draws."""
+    #Using inclusion-exclusion over the rows and columns: any a rows and b columns cover a*size + b*size - a*b
+    #cells, so the sum only needs to run over the (a, b) pairs.
+    #Limiting the rounds to the numbers available.
+    rounds = min(rounds, number_range)
+    #Initializing the sum of the inclusion-exclusion terms.
+    total = Fraction(0)
+    #Creating a loop over every count of rows and columns in a group of lines.
+    for a in range(size + 1):
+        for b in range(size + 1):
+            #Skipping the empty group of lines.
+            if a == b == 0:
+                continue
+            #Counting the cells covered by a rows and b columns.
+            cells = (a + b) * size - a * b
+            #Adding the term of every group of a rows and b columns with its inclusion-exclusion sign.
+            sign = 1 if (a + b) % 2 else -1
+            total += sign * comb(size, a) * comb(size, b) * _all_drawn(cells, number_range, rounds)
+    return total
+
+
+#Defining a function that precomputes the probabilities for every possible number of rounds.
+@lru_cache(maxsize=32)
+def probability_table(size: int = 4, number_range: int = 99):
+    """Returns a tuple of (rounds, line_probability, bingo_probability) for every rounds in 1..number_range."""
+    return tuple(
+        (k, line_probability(k, size, number_range), bingo_probability(k, size, number_range))
+        for k in range(1, number_range + 1)
+    )
@@ -0,0 +1,121 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from game.card import BingoCard
+from game.draw import NumberDrawer
+from game.engine import GAME_MODES, win_rounds
+from game.stats import RoundStats
+
+
+#Defining a class named ModeStats as a dataclass, holding the simulated odds of one game mode.
+@dataclass
+class ModeStats:
+    """Simulated outcome rates of one game mode."""
+    #Storing the mode name and its number of rounds.
+    name: str
+    rounds: int
+    #Storing the share of games won (bingo within the rounds).
+    win_rate: float
+    #Storing the share of games with at least one line within the rounds.
+    first_line_rate: float
+    #Storing the average bingo round among the games won in this mode (None if none were won).
+    mean_rounds_to_bingo: float = None
+
+
+#Defining a class named SimulationReport as a dataclass, holding the results of a simulation run.
+@dataclass
+class SimulationReport:
+    """Results of a Monte Carlo simulation across every game mode."""
+    #Storing the number of simulated games.
+    games: int
+    #Storing how many games reached their bingo (index = round) and their first line in each round.
+    bingo_rounds: List[int]
+    first_line_rounds: List[int]
+    #Storing the per-mode rates, keyed by mode name.
+    modes: Dict[str, ModeStats] = field(default_factory=dict)
+    #Storing the streaming statistics of the bingo and first-line rounds (games that reached them only).
+    bingo_stats: RoundStats = None
+    first_line_stats: RoundStats = None
+
+
+#Defining a helper function that runs one batch of games in a worker process.
+def _simulate_batch(games: int, seed: str, size: int, number_range: int, max_rounds: int):
+    """Plays a batch of full-length games with its own seeded generator and returns its round statistics."""
+    #Creating the generator of this batch; string seeds are hashed, so every batch gets an independent stream.
+    rng = random.Random(seed)
+    #Initializing the statistics of the bingo and first-line rounds (fixed size, mergeable across processes).
+    bingo_stats = RoundStats(number_range)
+    first_line_stats = RoundStats(number_range)
+    #Creating a loop that plays every game of the batch.
+    for _ in range(games):
+        #Creating the card and drawing the full draw order with the batch generator.
+        card = BingoCard(size, number_range, rng=rng)
+        drawer = NumberDrawer(number_range, rng=rng)
+        draws = [drawer.draw_number() for _ in range(max_rounds)]
+        #Finding when this card gets its first line and its bingo, and recording the rounds that happened.
+        first_line, bingo = win_rounds(card, draws)
+        if first_line:
+            first_line_stats.add(first_line)
+        if bingo:
+            bingo_stats.add(bingo)
+    return bingo_stats, first_line_stats
+
+
+#Defining a helper function that turns round histograms into per-mode rates.
+def _mode_stats(name: str, rounds: int, games: int, bingo_rounds: List[int], first_line_rounds: List[int]) -> ModeStats:
+    """Computes the win rate, first-line rate and mean rounds-to-bingo of one mode."""
+    #Counting the games whose bingo and first line happened within the rounds of the mode.
+    wins = sum(bingo_rounds[1:rounds + 1])
+    lines = sum(first_line_rounds[1:rounds + 1])
+    #Averaging the bingo round of the games won.
+    total_rounds = sum(r * bingo_rounds[r] for r in range(1, rounds + 1))
+    return ModeStats(
+        name=name,
+        rounds=rounds,
+        win_rate=wins / games if games else 0.0,
+        first_line_rate=lines / games if games else 0.0,
+        mean_rounds_to_bingo=total_rounds / wins if wins else None,
+    )
+
+
+#Defining the main simulation function. Every game is played once up to the longest mode and counts for all modes;
+#batches are seeded from the base seed and their index only, so any worker count gives the same report.
+def simulate(games: int, workers: int = None, seed=None, size: int = 4, number_range: int = 99,
+             modes=GAME_MODES, batch_size: int = 2000) -> SimulationReport:
+    """Plays many headless games across a process pool and reports the odds of every mode."""
+    #Using every core by default.
+    workers = workers or os.cpu_count() or 1
+    #Picking a random base seed when none is given, so independent runs still differ.
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    #Drawing only as many numbers as the longest mode can use.
+    max_rounds = min(number_range, max(rounds for _, rounds in modes))
+    #Splitting the games into fixed-size batches (the last one may be smaller).
+    sizes = [min(batch_size, games - start) for start in range(0, games, batch_size)]
+    #Giving every batch its own seed derived from the base seed and the batch index.
+    args = [(n, f"{seed}:{i}", size, number_range, max_rounds) for i, n in enumerate(sizes)]
+
+    #Running the batches inline for a single worker, or across a process pool otherwise.
+    if workers == 1 or len(args) == 1:
+        results = [_simulate_batch(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_simulate_batch, *zip(*args)))
+
+    #Merging the statistics of every batch.
+    bingo_stats = RoundStats(number_range)
+    first_line_stats = RoundStats(number_range)
+    for batch_bingo, batch_line in results:
+        bingo_stats.merge(batch_bingo)
+        first_line_stats.merge(batch_line)
+    #Turning them into round histograms where index 0 counts the games that never got there.
+    bingo_rounds = [games - bingo_stats.count] + bingo_stats.histogram[1:]
+    first_line_rounds = [games - first_line_stats.count] + first_line_stats.histogram[1:]
+    #Building the report with the rates of every mode.
+    report = SimulationReport(games, bingo_rounds, first_line_rounds, bingo_stats=bingo_stats, first_line_stats=first_line_stats)
+    for name, rounds in modes:
+        report.modes[name] = _mode_stats(name, rounds, games, bingo_rounds, first_line_rounds)
+    return report
@@ -0,0 +1,93 @@
+import math
+from dataclasses import dataclass, field
+from typing import List
+
+
+#Defining a class named RoundStats as a dataclass, a fixed-size summary of "in which round did it happen".
+#Its memory is fixed by number_range, every add() is O(1), and summaries from different processes merge exactly.
+@dataclass
+class RoundStats:
+    """Streaming statistics of round numbers in 1..number_range: histogram, mean and variance."""
+    #Storing the largest round that can be recorded.
+    number_range: int = 99
+    #Storing how many times each round was recorded (index = round, index 0 is unused).
+    histogram: List[int] = field(default_factory=list)
+    #Storing the number of values, their running mean and the running sum of squared deviations (Welford).
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    #Defining a post-initialization step that sizes the histogram.
+    def __post_init__(self):
+        if not self.histogram:
+            self.histogram = [0] * (self.number_range + 1)
+
+    #Defining a method that records one round.
+    def add(self, value: int):
+        """Records one round in O(1)."""
+        self.histogram[value] += 1
+        #Updating the running mean and squared deviations (Welford's algorithm).
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    #Defining a method that adds another summary into this one.
+    def merge(self, other: "RoundStats"):
+        """Adds the values recorded by another summary (Chan's parallel update for mean and variance)."""
+        #Returning early if the other summary is empty.
+        if not other.count:
+            return self
+        #Adding the histograms, growing this one if the other covers a larger range.
+        if other.number_range > self.number_range:
+            self.histogram += [0] * (other.number_range - self.number_range)
+            self.number_range = other.number_range
+        for value, hits in enumerate(other.histogram):
+            self.histogram[value] += hits
+        #Combining the means and squared deviations.
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        return self
+
+    #Defining the variance and the standard deviation of the recorded rounds.
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    #Defining a method returning a percentile from the histogram.
+    def percentile(self, p: float):
+        """Returns the smallest round r such that at least p% of the values are <= r (None if empty)."""
+        if not self.count:
+            return None
+        #Walking the histogram until the cumulative count reaches the target rank.
+        target = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for value, hits in enumerate(self.histogram):
+            seen += hits
+            if seen >= target:
+                return value
+        return self.number_range
+
+    #Defining an alternative constructor that rebuilds a summary from a histogram alone.
+    @classmethod
+    def from_histogram(cls, histogram: List[int]):
+        """Rebuilds the summary (mean and variance included) from a histogram."""
+        stats = cls(len(histogram) - 1)
+        stats.merge_histogram(histogram)
+        return stats
+
+    #Defining a method that adds a whole histogram of rounds at once.
+    def merge_histogram(self, histogram: List[int]):
+        """Adds the values of a histogram, computing their mean and variance exactly."""
+        other = RoundStats(len(histogram) - 1, list(histogram), sum(histogram))
+        if other.count:
+            other.mean = sum(v * h for v, h in enumerate(histogram)) / other.count
+            other.m2 = sum(h * (v - other.mean) ** 2 for v, h in enumerate(histogram))
+        return self.merge(other)
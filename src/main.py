@@ -1,13 +1,121 @@
 
+import argparse
+import signal
+import sys
+import time
+
+from tabulate import tabulate
+
+from game.engine import play_game
+from game.simulate import simulate
 from ui.display import History
 from ui.display import InfoTab
 from ui.display import MiniBingo
 
+#Defining a helper function that reads a count of games, which must be at least 1.
+def positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1 (got {value})")
+    return value
+
+#Defining a function that reads the command line options.
+def parse_args(argv=None):
+    """Parse the command line options of the Mini Bingo program."""
+    #Creating the parser with a short description of the program.
+    parser = argparse.ArgumentParser(description="Mini Bingo (terminal version).")
+    #Adding the option to run games automatically, without prompts or per-round output.
+    parser.add_argument("--auto", action="store_true", help="play games headlessly and report games/sec")
+    #Adding the option to choose how many automatic games to run.
+    parser.add_argument("--games", type=positive_int, default=1000, help="number of games to play with --auto")
+    #Adding the option to choose the number of rounds per automatic game.
+    parser.add_argument("--rounds", type=int, default=99, help="rounds per game with --auto or --curses (30, 70 or 99)")
+    #Adding the option to play on a full-screen curses interface, and its automatic draw rate.
+    parser.add_argument("--curses", action="store_true", help="play on a full-screen terminal interface")
+    parser.add_argument("--rate", type=float, default=0.0, help="draws per second with --curses (0: draw on key press)")
+    #Adding the option to estimate the odds of every mode with a Monte Carlo simulation.
+    parser.add_argument("--simulate", type=positive_int, metavar="GAMES", help="simulate GAMES games and report the odds of every mode")
+    #Adding the options controlling the simulation workers and seed.
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for --simulate (default: all cores)")
+    parser.add_argument("--seed", type=int, default=None, help="base seed for --simulate")
+    return parser.parse_args(argv)
+
+#Defining a function that runs the simulator and prints the odds of every mode.
+def run_simulation(games: int, workers: int = None, seed: int = None):
+    """Simulate the given number of games and print the win and first-line rates of every mode."""
+    #Starting the timer.
+    start = time.perf_counter()
+    #Running the simulation across the worker processes.
+    report = simulate(games, workers=workers, seed=seed)
+    #Stopping the timer.
+    elapsed = time.perf_counter() - start
+    #Creating one table row per mode.
+    data = [
+        [m.name, m.rounds, f"{m.win_rate:.4%}", f"{m.first_line_rate:.4%}",
+         "-" if m.mean_rounds_to_bingo is None else f"{m.mean_rounds_to_bingo:.2f}"]
+        for m in report.modes.values()
+    ]
+    #Printing the table and the throughput.
+    print(tabulate(data, headers=["Mode", "Rounds", "Win rate", "First line rate", "Avg. bingo round"], tablefmt="fancy_grid"))
+    print(f"Simulated {games} games in {elapsed:.2f}s ({games / elapsed if elapsed else float('inf'):,.0f} games/sec)")
+
+#Defining a function that plays many games without any interaction and reports the throughput.
+def run_auto(games: int, rounds: int):
+    """Play the given number of headless games and print the win rate and games per second."""
+    #Initializing the counters of wins and lines.
+    wins = lines = 0
+    #Starting the timer.
+    start = time.perf_counter()
+    #Creating a loop that plays every game through the headless engine.
+    for _ in range(games):
+        result = play_game(rounds)
+        wins += result.won
+        lines += result.lines
+    #Stopping the timer.
+    elapsed = time.perf_counter() - start
+    #Printing the results and the throughput.
+    print(f"Played {games} games of {rounds} rounds in {elapsed:.2f}s "
+          f"({games / elapsed if elapsed else float('inf'):,.0f} games/sec)")
+    print(f"Wins: {wins} ({wins / games if games else 0:.2%}) | Lines: {lines}")
+
 #Defining the main function hat runs the Bingo session
-def main():
+def main(argv=None):
     """Run a minimal playable Mini Bingo session (Sprint 2 demo)."""
-    #Creting a History object to track the results of completed matches.
-    history = History()
+    #Reading the command line options.
+    args = parse_args(argv)
+    #Checking if the headless automatic mode was requested.
+    if args.auto:
+        #In this case, playing the games without prompts and leaving.
+        run_auto(args.games, args.rounds)
+        return
+    #Checking if a simulation was requested.
+    if args.simulate is not None:
+        #In this case, running it and leaving.
+        run_simulation(args.simulate, args.workers, args.seed)
+        return
+    #Loading the History of previous sessions; every finished match is journaled as soon as it ends
+    #(or, with HISTORY_WRITE_BEHIND=1, by a background thread at a fixed interval).
+    history = History.load(flush_every=1)
+    #Turning SIGTERM (e.g. "docker stop") into a normal exit, so the final flush below still runs.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    try:
+        #Checking if the full-screen interface was requested.
+        if args.curses:
+            #Importing curses only here, since it is not available on every platform (e.g. Windows).
+            import curses
+            from ui.terminal import play_curses
+            #In this case, playing on it (curses.wrapper restores the terminal on exit) and showing the summary.
+            curses.wrapper(play_curses, args.rounds, args.rate, history)
+            history.print_summary()
+        else:
+            play_session(history)
+    finally:
+        #Writing every game still buffered before the program ends.
+        history.close()
+
+#Defining a function that runs interactive matches until the player stops.
+def play_session(history: History):
+    """Play matches until the player declines a replay, recording each one in the history."""
     #Creating a InfoTab object to display game information and instructions.
     info = InfoTab()
     #Initializing a counter for the number of games played. Starting the matches counter at match 1. 
@@ -23,7 +131,7 @@ def main():
         #Storing the results of the matches (indicating whether the player won the matches).
         did_win = game.start()
         #Updating the matches history with the result of the match. 
-        history.update_history(did_win)
+        history.update_history(did_win, game.result)
         #Starting another loop to repeatedly ask the player whether they want to play again, until opposite input is given.
         while True:
             #Asking the player for input: if they want (yes) or not (no) to play another round.
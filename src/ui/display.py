@@ -1,43 +1,291 @@
 import json
 from game.card import BingoCard
 from game.draw import NumberDrawer
-from dataclasses import dataclass, asdict
+from game.engine import GAME_MODES, GameEngine, GameResult, mode_name
+from game.stats import RoundStats
+from ui.history_db import SQLiteHistoryStore
+from ui.render import ConsoleRenderer
+from dataclasses import dataclass, field
+from typing import Dict
 from tabulate import tabulate
 from pathlib import Path
 import os
+import threading
 
 HISTORY_DIR = Path(os.environ.get("HISTORY_DIR", "data"))
 HISTORY_FILE = HISTORY_DIR / "history.json"
+#Naming the append-only journal (one JSON line per finished game) stored next to the snapshot.
+JOURNAL_NAME = "history.jsonl"
+#Choosing where the history is stored: "json" (snapshot + journal) or "sqlite" (history.db).
+HISTORY_BACKEND = os.environ.get("HISTORY_BACKEND", "json")
+#Choosing whether finished games are written by a background thread, and how often it writes (seconds).
+HISTORY_WRITE_BEHIND = os.environ.get("HISTORY_WRITE_BEHIND", "0") == "1"
+HISTORY_FLUSH_INTERVAL = float(os.environ.get("HISTORY_FLUSH_INTERVAL", "2.0"))
+#Choosing whether every history write is forced to disk with fsync.
+HISTORY_FSYNC = os.environ.get("HISTORY_FSYNC", "0") == "1"
 
 
 @dataclass
 #Defining a class named History as a dataclass, which automatically generates an initializer and representation.
+#Every finished game is appended as one compact JSON line to a journal, periodically compacted into the snapshot.
 class History:
-    """Tracks the current playing session: games played, wins, and losses."""
+    """Tracks the playing history: games played, wins, and losses."""
     #Defining a data attribute with the value of total games played. Initializing the attribute at 0.
     games_played: int = 0
     #Defining a data attribute with the value of number of wins. Initializing the attribute at 0.
     wins: int = 0
     #Defining a data attribute with the value of number of losses. Initializing the attribute at 0.
     losses: int = 0
+    #Defining the directory holding the snapshot and the journal (HISTORY_DIR by default).
+    directory: Path = field(default_factory=lambda: HISTORY_DIR, repr=False, compare=False)
+    #Defining how many finished games are buffered before they are appended to the journal.
+    flush_every: int = field(default=16, repr=False, compare=False)
+    #Defining how many journal records trigger a compaction into the snapshot.
+    compact_every: int = field(default=10_000, repr=False, compare=False)
+    #Defining the storage backend: "json" (snapshot + journal) or "sqlite" (HISTORY_BACKEND by default).
+    backend: str = field(default_factory=lambda: HISTORY_BACKEND, repr=False, compare=False)
+    #Defining whether games are written by a background thread every flush_interval seconds (write-behind).
+    write_behind: bool = field(default_factory=lambda: HISTORY_WRITE_BEHIND, repr=False, compare=False)
+    flush_interval: float = field(default_factory=lambda: HISTORY_FLUSH_INTERVAL, repr=False, compare=False)
+    #Defining whether every write is forced to disk with fsync (slower, but survives power loss).
+    fsync: bool = field(default_factory=lambda: HISTORY_FSYNC, repr=False, compare=False)
+    #Defining the largest round a game can last, which bounds the size of the histograms.
+    number_range: int = field(default=99, repr=False, compare=False)
+    #Defining the per-mode game counts and the per-mode rounds-to-bingo and rounds-to-first-line statistics.
+    mode_games: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+    rounds_to_bingo: Dict[str, RoundStats] = field(default_factory=dict, repr=False, compare=False)
+    rounds_to_line: Dict[str, RoundStats] = field(default_factory=dict, repr=False, compare=False)
+    #Creating the buffer of records not yet written, and the count of records in the journal.
+    _pending: list = field(default_factory=list, init=False, repr=False, compare=False)
+    _journal_records: int = field(default=0, init=False, repr=False, compare=False)
+    _store: SQLiteHistoryStore = field(default=None, init=False, repr=False, compare=False)
+    #Creating the locks: _lock guards the counts and the buffer, _io_lock serializes the writes.
+    #When both are needed, _io_lock is always taken first.
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _io_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _flusher: "HistoryFlusher" = field(default=None, init=False, repr=False, compare=False)
 
-    #Defining a method to update the game statistics.
-    def update_history(self, win: bool):
-        """Updates the count of games played, wins, and losses."""
+    #Defining a post-initialization step that opens the SQLite store and starts the background writer if needed.
+    def __post_init__(self):
+        if self.backend == "sqlite":
+            self._store = SQLiteHistoryStore(self.directory)
+        elif self.backend != "json":
+            raise ValueError(f"Unknown history backend: {self.backend!r}")
+        if self.write_behind:
+            self._flusher = HistoryFlusher(self, self.flush_interval)
+            self._flusher.start()
+
+    #Defining the paths of the snapshot and of the journal.
+    @property
+    def snapshot_path(self) -> Path:
+        return Path(self.directory) / HISTORY_FILE.name
+
+    @property
+    def journal_path(self) -> Path:
+        return Path(self.directory) / JOURNAL_NAME
+
+    #Defining a class method that rebuilds the history from the snapshot and the journal.
+    @classmethod
+    def load(cls, **options):
+        """Loads the snapshot, then streams the journal records written after it."""
+        #Creating an empty history with the given options (directory, flush_every, ...).
+        history = cls(**options)
+        #Reading the counts and histograms from the aggregate tables when the SQLite backend is used.
+        if history._store is not None:
+            history._load_snapshot(history._store.totals(history.number_range))
+            return history
+        #Reading the aggregates and the journal offset they already include from the snapshot.
+        offset = 0
+        if history.snapshot_path.exists():
+            with history.snapshot_path.open(encoding="utf-8") as f:
+                snapshot = json.load(f)
+            history._load_snapshot(snapshot)
+            offset = snapshot.get("journal_offset", 0)
+            #Resetting an offset past the end of the journal (a crash in compact() after the journal was emptied)
+            #and saving the reset, so the games appended by later sessions are not skipped once it grows past it.
+            size = history.journal_path.stat().st_size if history.journal_path.exists() else 0
+            if offset > size:
+                offset = 0
+                history._write_snapshot(0, snapshot)
+        #Streaming the journal line by line, so memory does not grow with the number of games.
+        if history.journal_path.exists():
+            with history.journal_path.open("rb") as f:
+                f.seek(offset)
+                for line in f:
+                    #Skipping a partially written last line left by a crash.
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    history._apply(record)
+                    history._journal_records += 1
+        return history
+
+    #Defining a helper method that restores the aggregates stored in a snapshot.
+    def _load_snapshot(self, snapshot: dict):
+        self.games_played = snapshot.get("games_played", 0)
+        self.wins = snapshot.get("wins", 0)
+        self.losses = snapshot.get("losses", 0)
+        #Rebuilding the per-mode statistics from their histograms (mean and variance are recomputed exactly).
+        for mode, data in snapshot.get("modes", {}).items():
+            self.mode_games[mode] = data["games"]
+            self.rounds_to_bingo[mode] = RoundStats.from_histogram(data["bingo"])
+            self.rounds_to_line[mode] = RoundStats.from_histogram(data["first_line"])
+
+    #Defining a helper method returning the aggregates stored in a snapshot.
+    def _snapshot(self) -> dict:
+        return {
+            "games_played": self.games_played, "wins": self.wins, "losses": self.losses,
+            "modes": {
+                mode: {"games": games, "bingo": self._mode_stats(self.rounds_to_bingo, mode).histogram,
+                       "first_line": self._mode_stats(self.rounds_to_line, mode).histogram}
+                for mode, games in self.mode_games.items()
+            },
+        }
+
+    #Defining a helper method returning (creating if needed) the statistics of one mode.
+    def _mode_stats(self, stats: Dict[str, RoundStats], mode: str) -> RoundStats:
+        if mode not in stats:
+            stats[mode] = RoundStats(self.number_range)
+        return stats[mode]
+
+    #Defining a helper method that adds one finished game to the aggregates.
+    def _apply(self, record: dict):
         #Incrementing the total count of completed games by 1.
         self.games_played += 1
         #Checking if the game was won.
-        if win:
+        if record["won"]:
             #In this case, incrementing the win counter by one. 
             self.wins += 1
         #If the game was lost.
         else:
             #In this case, incrementing the loss counter by one.
             self.losses += 1
+        #Updating the per-mode statistics in O(1) when the record says which mode was played.
+        mode = record.get("mode")
+        if mode is not None:
+            self.mode_games[mode] = self.mode_games.get(mode, 0) + 1
+            if record.get("bingo"):
+                self._mode_stats(self.rounds_to_bingo, mode).add(record["bingo"])
+            if record.get("first_line"):
+                self._mode_stats(self.rounds_to_line, mode).add(record["first_line"])
+
+    #Defining a method that adds the results of another history (e.g. from another process) to this one.
+    def merge(self, other: "History"):
+        """Adds another history's counts and per-mode statistics to this one (nothing is journaled)."""
+        with self._lock:
+            self.games_played += other.games_played
+            self.wins += other.wins
+            self.losses += other.losses
+            for mode, games in other.mode_games.items():
+                self.mode_games[mode] = self.mode_games.get(mode, 0) + games
+            for mine, theirs in ((self.rounds_to_bingo, other.rounds_to_bingo), (self.rounds_to_line, other.rounds_to_line)):
+                for mode, stats in theirs.items():
+                    self._mode_stats(mine, mode).merge(stats)
+        return self
+
+    #Defining a method to update the game statistics.
+    def update_history(self, win: bool, result: GameResult = None):
+        """Updates the count of games played, wins, and losses, and journals the finished game."""
+        #Creating the compact record of the game (mode, rounds, lines and winning rounds when known).
+        record = {"won": bool(win)}
+        if result is not None:
+            record.update(
+                mode=mode_name(result.max_rounds), rounds=result.max_rounds, played=result.rounds_played,
+                lines=result.lines, first_line=result.first_line_round, bingo=result.bingo_round,
+            )
+        #Adding the game to the aggregates and buffering its record.
+        with self._lock:
+            self._apply(record)
+            self._pending.append(record)
+            full = len(self._pending) >= self.flush_every
+        #Writing the buffer once it is full, unless the background writer takes care of it.
+        if full and self._flusher is None:
+            self.flush()
+
+    #Defining a method that appends the buffered records to the journal.
+    def flush(self):
+        """Appends every buffered game to the journal (or the database) in a single write."""
+        with self._io_lock:
+            #Taking the whole buffer at once, so new games can keep arriving while it is written.
+            with self._lock:
+                batch, self._pending = self._pending, []
+            #Checking if there is anything to write.
+            if not batch:
+                return
+            self._write(batch)
+            #Compacting once the journal has grown large.
+            needs_compaction = self._store is None and self._journal_records >= self.compact_every
+        if needs_compaction:
+            self.compact()
+
+    #Defining a helper method that writes a batch of records (the caller holds _io_lock).
+    def _write(self, batch):
+        #Writing the batch in one transaction when the SQLite backend is used.
+        if self._store is not None:
+            self._store.write(batch)
+            return
+        #Ensuring the directory exists, then appending one compact JSON line per game in a single write.
+        #A crash can only tear the last line, which load() skips.
+        Path(self.directory).mkdir(parents=True, exist_ok=True)
+        with self.journal_path.open("a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(r, separators=(",", ":")) + "\n" for r in batch))
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        self._journal_records += len(batch)
+
+    #Defining a method that folds the journal into the snapshot.
+    def compact(self):
+        """Writes the aggregates to the snapshot and empties the journal."""
+        #Skipping the SQLite backend, which keeps its aggregates up to date on every write.
+        if self._store is not None:
+            return
+        with self._io_lock:
+            #Taking the buffer and copying the counts together, so the snapshot covers exactly the journal;
+            #the game thread is only blocked for the copy, not for the writes below.
+            with self._lock:
+                batch, self._pending = self._pending, []
+                snapshot = self._snapshot()
+            if batch:
+                self._write(batch)
+            Path(self.directory).mkdir(parents=True, exist_ok=True)
+            size = self.journal_path.stat().st_size if self.journal_path.exists() else 0
+            self._write_snapshot(size, snapshot)
+            #Emptying the journal, then marking the snapshot as covering none of it (the snapshot written first
+            #records the journal size it covers, so a crash before the truncation does not count those games twice).
+            if size:
+                self.journal_path.open("w").close()
+                self._write_snapshot(0, snapshot)
+            self._journal_records = 0
+
+    #Defining a method that writes everything still buffered and stops the background writer.
+    def close(self):
+        """Flushes the remaining games, stops the background writer and closes the database."""
+        #Stopping the background writer, which performs a final flush on its way out.
+        if self._flusher is not None:
+            self._flusher.stop()
+            self._flusher = None
+        self.flush()
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    #Defining a helper method that replaces the snapshot atomically.
+    def _write_snapshot(self, journal_offset: int, snapshot: dict = None):
+        #Writing to a temporary file first, so the snapshot is never left half written.
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({**(snapshot or self._snapshot()), "journal_offset": journal_offset}, f, indent=2)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        #Swapping the complete file into place in one step.
+        os.replace(tmp, self.snapshot_path)
 
     #Defining a method to show the summary of accumulated results.
     def print_summary(self):
-        """Displays the session summary in a table."""
+        """Displays the summary of every recorded game in a table."""
         #Creating a list of lists, where each row represents one statistic (attribute) and its value. 
         data = [
             ["Rounds Played", self.games_played],
@@ -45,18 +293,64 @@ class History:
             ["Losses", self.losses]
         ]
         #Setting a title to display before the summary of results table. 
-        title = "📊SESSION SUMMARY"
+        title = "📊HISTORY SUMMARY (all sessions)"
         #Printing the title and a line separator of matching width. 
         print(f"\n{title}\n" + "-" * (len(title) + 2))
         #Displaying the summary of the results in a formatted grid style.
         print(tabulate(data, headers=["Statistic", "Count"], tablefmt="fancy_grid"))
+        #Displaying the per-mode distribution of rounds to bingo and to the first line.
+        if self.mode_games:
+            print(tabulate(self._mode_rows(), headers=[
+                "Mode", "Games", "Win rate", "Bingo round (avg ± sd)", "Bingo p50/p90",
+                "First line (avg ± sd)", "First line p50/p90",
+            ], tablefmt="fancy_grid"))
+
+    #Defining a helper method building one summary row per mode.
+    def _mode_rows(self):
+        """Returns the rows of the per-mode table shown by print_summary()."""
+        rows = []
+        for mode, games in sorted(self.mode_games.items()):
+            bingo = self._mode_stats(self.rounds_to_bingo, mode)
+            line = self._mode_stats(self.rounds_to_line, mode)
+            rows.append([
+                mode, games, f"{bingo.count / games:.1%}",
+                f"{bingo.mean:.1f} ± {bingo.stdev:.1f}" if bingo.count else "-",
+                f"{bingo.percentile(50)}/{bingo.percentile(90)}" if bingo.count else "-",
+                f"{line.mean:.1f} ± {line.stdev:.1f}" if line.count else "-",
+                f"{line.percentile(50)}/{line.percentile(90)}" if line.count else "-",
+            ])
+        return rows
 
     def save(self):
-        """Save the history to a file in a Python dictionary format for the Docker volume.
-        With variables in mkdir() we ensure that the directory is created/exists, so that we do not encounter nay errors """
-        HISTORY_DIR.mkdir(parents=True, exist_ok=True)
-        with HISTORY_FILE.open("w", encoding="utf-8") as f:
-            json.dump(asdict(self), f, indent=2)
+        """Save the history for the Docker volume: flushes the buffered games and compacts the journal into the snapshot.
+        The directory is created if needed, so that we do not encounter any errors """
+        self.flush()
+        self.compact()
+
+#Defining a class named HistoryFlusher, a background thread that writes a History's buffered games.
+class HistoryFlusher(threading.Thread):
+    """Write-behind thread: flushes a History every `interval` seconds, and once more when stopped."""
+
+    #Defining the constructor, storing the history and the interval between writes.
+    def __init__(self, history: History, interval: float):
+        super().__init__(name="history-flusher", daemon=True)
+        self.history = history
+        self.interval = interval
+        #Creating the event used both to wait between writes and to request the thread to stop.
+        self._stopping = threading.Event()
+
+    #Defining the loop of the thread: every game buffered during an interval is written in one batch.
+    def run(self):
+        while not self._stopping.wait(self.interval):
+            self.history.flush()
+        #Writing whatever arrived since the last interval before exiting.
+        self.history.flush()
+
+    #Defining a method that stops the thread and waits for its final write.
+    def stop(self):
+        self._stopping.set()
+        self.join()
+
 
 #Defining a class named InfoTab, which displays the rules of the game.
 class InfoTab:
@@ -101,46 +395,37 @@ class MiniBingo:
         self.rounds = 0
         #Creating an info instance to display the rules during the game.
         self.info = InfoTab()
+        #Creating placeholders for the game engine and the result of the finished game (set by start()).
+        self.engine = None
+        self.result = None
 
     #Defining a method to let the user select from predefined game lengths. 
     def choose_mode(self):
-        """Lets the player choose one of three predefined modes."""
-        #Displaying the available mode options to the player.
+        """Lets the player choose one of the predefined modes."""
+        #Creating the symbol shown when each mode is selected.
+        icons = {"Competitive": "🏁", "Normal": "🎯", "Easy": "🌿"}
+        #Displaying the available mode options to the player, numbered from 1, from the shared GAME_MODES table.
         print("\n🎮 Choose Game Mode:")
-        print("1. Competitive (30 rounds)")
-        print("2. Normal (45 rounds)")
-        print("3. Easy (99 rounds)")
+        for number, (name, rounds) in enumerate(GAME_MODES, 1):
+            print(f"{number}. {name} ({rounds} rounds)")
+        #Creating the list of valid answers, e.g. "1, 2, or 3".
+        numbers = [str(number) for number in range(1, len(GAME_MODES) + 1)]
+        options = ", ".join(numbers[:-1]) + ", or " + numbers[-1] if len(numbers) > 1 else numbers[0]
 
         #Starting a loop that continues until the user makes a valid choice. 
         while True:
             #Asking the player for input: select a mode. The answer is standardized: whitespaces are removed.
-            choice = input("Select a mode (1, 2, or 3): ").strip()
-
-            #Checking if the user input is "1".
-            if choice == "1":
-                #Setting the round count to 30.
-                self.rounds = 30
-                #Printing the mode selected: Competitive, and the number of rounds: 30 to the user. 
-                print("\n🏁 Mode selected: Competitive (30 rounds)")
-                break
-            #Checking if the user input is "2"
-            elif choice == "2":
-                #Setting the round count to 70.
-                self.rounds = 70
-                #Printing the mode selected: Normal, and the number of rounds: 70 to the user. 
-                print("\n🎯 Mode selected: Normal (70 rounds)")
-                break
-            #Checking if the user input is "3"
-            elif choice == "3":
-                #Setting the round count to 99 (maximum number).
-                self.rounds = 99
-                #Printing the mode selected: Easy, and the number of rounds: 99 to the user.
-                print("\n🌿 Mode selected: Easy (99 rounds)")
+            choice = input(f"Select a mode ({options}): ").strip()
+            #Checking if the user input is the number of a mode.
+            if choice in numbers:
+                #Setting the round count of the mode and printing the selection to the user.
+                name, self.rounds = GAME_MODES[int(choice) - 1]
+                print(f"\n{icons.get(name, '🎲')} Mode selected: {name} ({self.rounds} rounds)")
                 break
             #Handling any other user input.
             else:
                 #Displaying an error message and re-prompting.
-                print("⚠️ Invalid option. Please choose 1, 2, or 3.")
+                print(f"⚠️ Invalid option. Please choose {options}.")
 
     #Defining a method to run a full game session. 
     def start(self):
@@ -149,60 +434,40 @@ class MiniBingo:
         print("\n🧩 Welcome to Mini Bingo 🧩")
         #Calling the mode selection method.
         self.choose_mode()
-        #Displaying the rules.
-        self.info.display()
-        #Showing the initial bingo card. 
-        self.card.display_card()
+        #Creating the renderer, which caches the rules and card text and writes each frame at once.
+        renderer = ConsoleRenderer(self.card, self.drawer, self.info.rules_text)
+        #Displaying the rules and the initial bingo card.
+        renderer.intro()
 
-        #Creating a flag indicating whether the player wins the game. Initialized as False. 
-        won = False
+        #Creating the headless engine that applies the rules; this method only handles input and output.
+        self.engine = GameEngine(self.card, self.drawer, self.rounds)
 
         #Creating a loop through each round, starting at 1 up to the number of rounds selected.
         for round_number in range(1, self.rounds + 1):
             #Prompting the user to proceed to the next draw (next round).
             input(f"\n👉 Press Enter to draw number for Round {round_number}...")
 
-            #Drawing a number from the random pool.
-            number = self.drawer.draw_number()
+            #Drawing a number from the random pool, marking it and checking lines and bingo.
+            outcome = self.engine.step()
             #Checking if no number remains available.
-            if number is None:
+            if outcome is None:
                 #Notifying the player that there are no numbers left to be drawn.
                 print("No more numbers to draw.")
                 #Ending the game loop.
                 break
 
-            #Displaying the newly drawn number.
-            print(f"➡️ Drawn number: {number}")
+            #Displaying the drawn number, the card row it marked and any line or bingo.
+            renderer.round(outcome)
 
-            #Checking if the number exists on the card and marking it.
-            if self.card.mark_number(number):
-                #Informing the player that the number was found and marked. 
-                print("Number found and marked on your card!")
-            #If the number isn't present. 
-            else:
-                #Informing the player that the number was not found.
-                print("Number not on your card.")
-
-            #Displaying the rules again.
-            self.info.display()
-            #Showing the updated card state (with the possible new marked number).
-            self.card.display_card()
-            #Showing all the previously drawn numbers.
-            self.drawer.display_drawn_numbers()
-
-            #Checking if the latest move completed a line (row or column).
-            if self.card.check_line():
-                #If true, announcing it. 
-                print("🎉 LINE! You completed a row or column!")
-
-            #Checking if the latest move completed the full card (bingo).
-            if self.card.check_bingo():
-                #If true, announcing it. 
-                print("🏆 BINGO! You completed the entire card!")
-                #Updating the win flag.
-                won = True
-                #Ending the game loop.
+            #Ending the game loop once the full card is completed (bingo).
+            if outcome.bingo:
                 break
 
+        #Showing the final card and every number drawn.
+        renderer.finish()
+        #Storing the summary of the finished game.
+        self.result = self.engine.result()
         #Printing a closing message after the loop finishes.
         print("\nThanks for playing")
+        #Returning whether the player won the game.
+        return self.result.won
@@ -16,12 +16,83 @@ if SRC_DIR not in sys.path:
 from ui.display import InfoTab
 from game.card import BingoCard
 from game.draw import NumberDrawer
+from game.engine import GAME_MODES, GameEngine
+
+#Defining the colors of an unmarked and a marked card cell.
+CELL_BG = "#ffffff"
+MARKED_BG = "#81c784"
+#Defining the most cards a game can be played with.
+MAX_CARDS = 60
+
+
+#Defining a class named CardCanvas, which draws whole cards on a single Canvas instead of one widget per cell.
+#Cell rectangles are tagged "cell{card}_{row}_{col}" and "num{number}", so marking a cell, or a number on every
+#card showing it, is a single itemconfig.
+class CardCanvas(tk.Canvas):
+    """Draws one or more bingo cards on one Canvas, with a rectangle and a text item per cell."""
+
+    #Defining the constructor, including the size of a cell and how many cards fit in a row.
+    def __init__(self, master, cell_size: int = 56, columns: int = 4, max_height: int = 420, **options):
+        super().__init__(master, bg=CELL_BG, highlightthickness=0, **options)
+        #Storing the size of a cell in pixels and the number of cards per row.
+        self.cell_size = cell_size
+        self.columns = columns
+        #Storing the tallest the canvas gets on screen (taller pages are scrolled) and the height of the current page.
+        self.max_height = max_height
+        self.page_height = 0
+        #Storing the cards currently drawn.
+        self.cards = []
+
+    #Defining a method that draws a page of cards, replacing the previous one.
+    def show(self, cards):
+        """Draws the cards in rows of `columns`, with their current marks."""
+        #Removing every item of the previous page (canvas items are cheap, no widgets are involved).
+        self.delete("all")
+        self.cards = list(cards)
+        if not self.cards:
+            return
+        size = self.cards[0].size
+        cs = self.cell_size
+        #Computing the gap between cards and the width of one card.
+        gap = cs // 2
+        card_w = size * cs
+        font = ("Arial", max(8, cs // 3), "bold")
+        #Creating a loop over every card and every cell of it.
+        for k, card in enumerate(self.cards):
+            #Placing the card in its row and column of the page.
+            page_row, page_col = divmod(k, self.columns)
+            x0, y0 = gap + page_col * (card_w + gap), gap + page_row * (card_w + gap)
+            for i, row in enumerate(card.grid):
+                for j, num in enumerate(row):
+                    x, y = x0 + j * cs, y0 + i * cs
+                    #Creating the cell rectangle (colored by its mark) and the number on top of it.
+                    self.create_rectangle(x, y, x + cs, y + cs, fill=MARKED_BG if card.marked[i][j] else CELL_BG,
+                                          outline="#90a4ae", width=2, tags=("cell", f"cell{k}_{i}_{j}", f"num{num}"))
+                    self.create_text(x + cs / 2, y + cs / 2, text=str(num), font=font)
+        #Sizing the scroll region to the page, and the canvas to the page up to max_height.
+        rows = -(-len(self.cards) // self.columns)
+        width = gap + min(self.columns, len(self.cards)) * (card_w + gap)
+        self.page_height = gap + rows * (card_w + gap)
+        self.configure(width=width, height=min(self.page_height, self.max_height), scrollregion=(0, 0, width, self.page_height))
+        self.yview_moveto(0)
+
+    #Defining a method that marks one cell of one card.
+    def mark(self, index: int, cell):
+        self.itemconfig(f"cell{index}_{cell[0]}_{cell[1]}", fill=MARKED_BG)
+
+    #Defining a method that marks a number on every card drawn on the canvas.
+    def mark_number(self, number: int):
+        self.itemconfig(f"num{number}", fill=MARKED_BG)
+
+    #Defining a method returning the color of a cell (e.g. to check whether it is marked).
+    def cell_color(self, index: int, cell) -> str:
+        return self.itemcget(f"cell{index}_{cell[0]}_{cell[1]}", "fill")
 
 #Defining a class named MiniBingo GUI inheriting from Tk (the main Tkinter window).
 class MiniBingoGUI(tk.Tk):
     
     #Defining the constructor method that initializes the GUI
-    def __init__(self):
+    def __init__(self, animation_steps: int = 15, animation_delay: int = 50, use_canvas: bool = False, n_cards: int = 1):
         #Initializing the Tk superclass, setting up the root window.
         super().__init__()
         #Maximizing the window to full screen.
@@ -38,20 +109,37 @@ class MiniBingoGUI(tk.Tk):
         self.card = None
         #Creating a placeholder for the number drawer instance (when game starts).
         self.drawer = None
+        #Creating a placeholder for the headless engine that applies the rules (when game starts).
+        self.engine = None
         #Storing the number of rounds the game is set to run (based on chosen mode).
         self.rounds = 0
         #Tracking the number of rounds played so far (so number of current round).
         self.current_round = 0
-        #Storing the numbers marked on the user's card.
-        self.marked = set()
-        #Storing the completed rows/columns on the user's card. 
-        self.completed_lines = set()
         #Holding references to each label widget representing the card cells. 
         self.card_labels = []
+        #Choosing whether the card is drawn on a single canvas instead of one label per cell.
+        self.use_canvas = use_canvas
+        self.card_canvas = None
+        self.card_scrollbar = None
+        #Storing how many cards the player plays at once; several cards share one drawer through a CardHall.
+        self.n_cards = n_cards
+        self.cards = []
+        self.hall = None
         #Storing the total number of lines the player has completed on the card.
         self.total_lines = 0
         #Creating a flag indicating whether the player has completed the full card (bingo). 
         self.bingo_achieved = False
+        #Storing the number of roulette frames shown before each draw and the delay between them (ms); 0 steps reveals at once.
+        self.animation_steps = animation_steps
+        self.animation_delay = animation_delay
+        #Creating a flag telling whether a draw is in progress, and the scheduled animation frame (if any).
+        self.drawing = False
+        self._animation_job = None
+        #Storing the interval between automatic draws (ms), the next scheduled draw, and the pacing clock.
+        self.auto_interval = 500
+        self.auto_job = None
+        self.auto_started = 0.0
+        self.auto_done = 0
 
         # --- UI widgets ---
         #Creating a visible frame that will contain the bingo card grid. 
@@ -105,8 +193,9 @@ class MiniBingoGUI(tk.Tk):
         #Packing scrollbar below the canvas.
         self.scrollbar.pack(side="bottom", fill="x")
 
-        #Storing reference to displayed labels for drawn numbers in a list. 
-        self.drawn_history_labels = []
+        #Storing the pool of history labels, created once and reconfigured in place, and how many are in use.
+        self.history_pool = []
+        self.history_used = 0
 
         #Creating a button for drawing a new random number (clicking triggers draw_number() method).
         self.draw_btn = tk.Button(
@@ -142,25 +231,42 @@ class MiniBingoGUI(tk.Tk):
         #Placing the button in the window with padding. 
         self.rules_btn.pack(pady=5)
 
+        #Creating a row with the automatic draw controls.
+        self.auto_frame = tk.Frame(self, bg="#e0f7fa")
+        self.auto_frame.pack(pady=5)
+        #Creating a button to start, pause and resume the automatic draws.
+        self.auto_btn = tk.Button(self.auto_frame, text="Auto Play", font=("Arial", 12, "bold"), bg="#9575cd", fg="black",
+                                  width=12, command=self.toggle_auto, state=tk.DISABLED)
+        self.auto_btn.pack(side="left", padx=5)
+        #Creating a spinbox choosing the interval between automatic draws, in milliseconds.
+        tk.Label(self.auto_frame, text="Interval (ms):", font=("Arial", 12), bg="#e0f7fa").pack(side="left")
+        self.interval_var = tk.IntVar(value=self.auto_interval)
+        tk.Spinbox(self.auto_frame, from_=1, to=5000, increment=50, width=6, textvariable=self.interval_var, font=("Arial", 12)).pack(side="left", padx=5)
+        #Creating a button that plays every remaining round at once.
+        self.skip_btn = tk.Button(self.auto_frame, text="Skip to End", font=("Arial", 12, "bold"), bg="#ff8a65", fg="black",
+                                  width=12, command=self.skip_to_end, state=tk.DISABLED)
+        self.skip_btn.pack(side="left", padx=5)
+
         #Show intro
         #Immediately opening an intro pop-up window when the game starts.
         self.show_intro()
 
     #Defining a method to show a fast animated number preview before a real draw.
-    def roulette_animation(self):
+    #Each frame is scheduled with after(), so the event loop keeps running; reveal_number() draws the real number.
+    def roulette_animation(self, steps_left=None):
         """Show fast random numbers before revealing the real drawn number"""
-        #Creating a variable to store the maximum number that can be shown in the animation (max number drawable). 
-        max_number = 99
-        #Creating a loop that runs the animation 15 times.
-        for _ in range(15):
-            #Generating a random temporary number for the animation. 
-            temp_num = random.randint(1, max_number)
-            #Updating the GUI label to show this temporary number.
-            self.drawn_label.config(text=str(temp_num))
-            #Forcing the GUI to refresh so the change appears on screen immediately.
-            self.update()
-            #Briefly pausing between updates to create animation effect.
-            time.sleep(0.05)
+        #Starting a new animation with the configured number of frames.
+        if steps_left is None:
+            steps_left = self.animation_steps
+        #Revealing the real number once every frame has been shown.
+        if steps_left <= 0:
+            self._animation_job = None
+            self.reveal_number()
+            return
+        #Updating the GUI label to show a random temporary number.
+        self.drawn_label.config(text=str(random.randint(1, self.card.number_range)))
+        #Scheduling the next frame after a short pause.
+        self._animation_job = self.after(self.animation_delay, self.roulette_animation, steps_left - 1)
 
     #Defining a method to display a pop-up window with the game rules.
     def show_rules(self):
@@ -287,7 +393,7 @@ class MiniBingoGUI(tk.Tk):
         #Setting the window title.
         mode_win.title("Choose Game Mode")
         #Setting the window size.
-        mode_win.geometry("360x260")
+        mode_win.geometry("360x300")
         #Setting the window background color.
         mode_win.configure(bg="#b2ebf2")
         #Ensuring this window stays in focus. 
@@ -296,21 +402,30 @@ class MiniBingoGUI(tk.Tk):
         #Adding the title label.
         tk.Label(mode_win, text="Choose Game Mode", font=("Arial", 16, "bold"), bg="#b2ebf2").pack(pady=10)
 
+        #Creating a spinbox to choose how many cards to play.
+        cards_var = tk.IntVar(value=self.n_cards)
+        cards_row = tk.Frame(mode_win, bg="#b2ebf2")
+        cards_row.pack()
+        tk.Label(cards_row, text="Cards:", font=("Arial", 12, "bold"), bg="#b2ebf2").pack(side="left")
+        tk.Spinbox(cards_row, from_=1, to=MAX_CARDS, width=4, textvariable=cards_var, font=("Arial", 12)).pack(side="left", padx=5)
+
         #Defining an internal function to apply the selected method.
         def set_mode(rounds):
-            #Storing the chosen number of rounds. 
+            #Storing the chosen number of rounds and of cards. 
             self.rounds = rounds
+            #Keeping the previous number of cards if the field is not a number.
+            try:
+                self.n_cards = min(MAX_CARDS, max(1, cards_var.get()))
+            except tk.TclError:
+                pass
             #Closing the mode selection window.
             mode_win.destroy()
             #Immediately starting the game.
             self.start_game()
 
-        #Creating a variable to store the available game modes (with name, round number, and color). 
-        modes = [
-            ("Competitive", 30, "#ff8a65"),
-            ("Normal", 70, "#4db6ac"),
-            ("Easy", 99, "#9575cd")
-        ]
+        #Creating a variable to store the available game modes (with name, round number, and color), from the shared table.
+        colors = {"Competitive": "#ff8a65", "Normal": "#4db6ac", "Easy": "#9575cd"}
+        modes = [(name, rounds, colors.get(name, "#4fc3f7")) for name, rounds in GAME_MODES]
 
         #Creating a loop over all available modes.
         for mode_name, rounds, color in modes:
@@ -325,28 +440,47 @@ class MiniBingoGUI(tk.Tk):
 
     #Defining a method to begin/reset a new game session. 
     def start_game(self):
-        #Creating a new bingo card object.
-        self.card = BingoCard()
         #Creating a new number drawer object (tracking the number that have been drawn).
         self.drawer = NumberDrawer()
-        #Creating a set of numbers that are marked on the user's card.
-        self.marked = set()
-        #Tracking which rows/columns have been counted as completed lines.
-        self.completed_lines = set()
+        #Checking if several cards are played.
+        if self.n_cards > 1:
+            #In this case, storing them in a hall, whose index finds every card holding a drawn number at once
+            #(imported here, so NumPy is only needed to play several cards).
+            from game.hall import CardHall
+            self.hall = CardHall(self.n_cards, number_range=self.drawer.max_number)
+            self.cards = [self.hall.card(i) for i in range(self.n_cards)]
+            self.card = self.cards[0]
+            self.engine = None
+        else:
+            #Creating a new bingo card object.
+            self.card = BingoCard()
+            self.cards = [self.card]
+            self.hall = None
+            #Creating the engine that draws, marks and checks the card on every round.
+            self.engine = GameEngine(self.card, self.drawer, self.rounds)
         #Resetting the number of draws made in this game. 
         self.current_round = 0
         #Resetting the count of lines made in this game. 
         self.total_lines = 0
         #Creating a flag indicating whether a full bingo has been achieved in this game.
         self.bingo_achieved = False
+        #Cancelling the animation of a draw still in progress from the previous game.
+        if self._animation_job is not None:
+            self.after_cancel(self._animation_job)
+            self._animation_job = None
+        self.drawing = False
+        #Stopping the automatic draws of the previous game.
+        self.stop_auto()
+        self.auto_btn.config(text="Auto Play", state=tk.NORMAL)
+        self.skip_btn.config(state=tk.NORMAL)
 
         #Reset drawn history
-        #Creating a loop through all history labels currently on screen.
-        for widget in self.scrollable_frame.winfo_children():
-            #Removing each widget from GUI.
-            widget.destroy()
-            #Also clearing internal list tracking those labels. 
-        self.drawn_history_labels.clear()
+        #Blanking the history slots used by the previous game (no widget is destroyed or created).
+        for lbl in self.drawn_history_labels:
+            lbl.config(text="", relief="flat")
+        self.history_used = 0
+        #Making sure the pool has one slot per number that can be drawn.
+        self.build_history_pool(self.card.number_range)
 
         #Displaying the new card on screen.
         self.display_card()
@@ -355,21 +489,56 @@ class MiniBingoGUI(tk.Tk):
 
     #Defining a method to draw the numebrs of the bingo card in the GUI grid. 
     def display_card(self):
+        #Drawing the cards on the canvas renderer when it is enabled or several cards are played.
+        if self.use_canvas or len(self.cards) > 1:
+            #Creating the canvas once, in place of the label grid.
+            if self.card_canvas is None:
+                for widget in self.card_frame.winfo_children():
+                    widget.destroy()
+                self.card_labels = []
+                self.card_canvas = CardCanvas(self.card_frame)
+                #Creating a vertical scrollbar for pages of cards taller than the canvas.
+                self.card_scrollbar = tk.Scrollbar(self.card_frame, orient="vertical", command=self.card_canvas.yview)
+                self.card_canvas.configure(yscrollcommand=self.card_scrollbar.set)
+                self.card_canvas.pack(side="left")
+            #Shrinking the cells and widening the rows of cards as more cards are played.
+            self.card_canvas.cell_size = 56 if len(self.cards) == 1 else 28
+            self.card_canvas.columns = min(len(self.cards), 10)
+            self.card_canvas.show(self.cards)
+            #Showing the scrollbar only when the page of cards does not fit in the canvas.
+            if self.card_canvas.page_height > self.card_canvas.max_height:
+                self.card_scrollbar.pack(side="right", fill="y")
+            else:
+                self.card_scrollbar.pack_forget()
+            return
+        #Rebuilding the grid of labels only when the card size changed (or on the first game).
+        if len(self.card_labels) != self.card.size:
+            self.build_card_grid(self.card.size)
+        #Creating a loop over each row of the card numbers. 
+        for row, row_labels in zip(self.card.grid, self.card_labels):
+            #Re-texting and resetting the colors of every existing label for the new card.
+            for num, lbl in zip(row, row_labels):
+                lbl.config(text=str(num), bg="#ffffff", fg="#000000")
+
+    #Defining a method that creates the label grid of a card size.
+    def build_card_grid(self, size):
         #Creating a loop through every widget inside self.card_frame.
         for widget in self.card_frame.winfo_children():
             #Deleting each old label. 
             widget.destroy()
 
+        #Forgetting the canvas renderer, if a multi-card game used it (it was destroyed above).
+        self.card_canvas = None
         #Creating a matrix storing label widgets for each number cell. 
         self.card_labels = []
-        #Creating a loop over each row of the card numbers. 
-        for r, row in enumerate(self.card.grid):
+        #Creating a loop over each row of the card. 
+        for r in range(size):
             #Hold the row's label widgets in a temporary list.
             row_labels = []
-            #Creating a loop through each number in the row.
-            for c, num in enumerate(row):
-                #Creating a visual cell showing the number.
-                lbl = tk.Label(self.card_frame, text=str(num), font=("Arial", 18, "bold"), width=4, height=2, bd=2, relief="ridge", bg="#ffffff", fg="#000000")
+            #Creating a loop through each cell in the row.
+            for c in range(size):
+                #Creating a visual cell (its number is set by display_card()).
+                lbl = tk.Label(self.card_frame, text="", font=("Arial", 18, "bold"), width=4, height=2, bd=2, relief="ridge", bg="#ffffff", fg="#000000")
                 #Placing the label in the correct grid position. 
                 lbl.grid(row=r, column=c, padx=5, pady=5)
                 #Storing the label in this row. 
@@ -377,16 +546,37 @@ class MiniBingoGUI(tk.Tk):
             #Adding the completed row to the master grid.
             self.card_labels.append(row_labels)
 
+    #Defining a property returning the history labels currently showing a drawn number.
+    @property
+    def drawn_history_labels(self):
+        return self.history_pool[:self.history_used]
+
+    #Defining a method that creates the fixed pool of history labels (once per number range).
+    def build_history_pool(self, size):
+        """Creates blank history labels until there is one per drawable number; existing ones are kept."""
+        #Creating only the missing slots, placed at fixed grid columns so later updates never re-layout the frame.
+        for column in range(len(self.history_pool), size):
+            lbl = tk.Label(self.scrollable_frame, text="", font=("Arial", 12, "bold"), bg="#e0f7fa", fg="#000000", width=4, relief="flat", bd=1)
+            lbl.grid(row=0, column=column, padx=2, pady=2)
+            self.history_pool.append(lbl)
+
     #Defining a method to update the sidebar list showing all numbers drawn.
-    def update_drawn_history(self, number):
-        #Creating a small label for the new drawn number.
-        lbl = tk.Label(self.scrollable_frame, text=str(number), font=("Arial", 12, "bold"), bg="#e0f7fa", fg="#000000", width=4, relief="ridge", bd=1)
-        #Placing the label horizontally in the scrollable frame.
-        lbl.pack(side="left", padx=2, pady=2)
-        #Adding it to the internal list of history labels. 
-        self.drawn_history_labels.append(lbl)
-        #Scrolling the display to the far right, so the latest number is visible. 
-        self.drawn_history_canvas.xview_moveto(1)
+    def update_drawn_history(self, number, scroll=True):
+        #Creating more slots in the unlikely case the pool is full.
+        if self.history_used == len(self.history_pool):
+            self.build_history_pool(self.history_used + 1)
+        #Showing the new number in the next free slot of the pool.
+        self.history_pool[self.history_used].config(text=str(number), relief="ridge")
+        self.history_used += 1
+        #Scrolling right away, unless the caller scrolls once after a batch of draws.
+        if scroll:
+            self.scroll_history()
+
+    #Defining a method that scrolls the history so the latest number is visible.
+    def scroll_history(self):
+        #Scrolling so the latest number is at the right edge of the visible area.
+        first, last = self.drawn_history_canvas.xview()
+        self.drawn_history_canvas.xview_moveto(max(0.0, self.history_used / len(self.history_pool) - (last - first)))
 
     #Defining a method to create the main logic for drawing the next random number.
     def draw_number(self):
@@ -396,42 +586,104 @@ class MiniBingoGUI(tk.Tk):
             self.end_round()
             return
 
-        #Running the visual animation before revealing the drawn number.
+        #Ignoring the click if the previous draw is still being animated, so draws cannot overlap.
+        if self.drawing:
+            return
+        self.drawing = True
+        #Disabling the draw button until the number is revealed.
+        self.draw_btn.config(state=tk.DISABLED)
+        #Running the visual animation, which reveals the drawn number when it ends.
         self.roulette_animation()
-        #Drawing a number from the available pool. 
-        number = self.drawer.draw_number()
-        #Checking if there are no numbers left to draw.
-        if number is None:
+
+    #Defining a method that draws the real number at the end of the animation and shows its effects.
+    def reveal_number(self):
+        #Marking the draw as finished and enabling the draw button again.
+        self.drawing = False
+        self.draw_btn.config(state=tk.NORMAL)
+        #Playing the round on the card(s).
+        played = self.play_round()
+        #Checking if there are no numbers or rounds left.
+        if played is None:
             #In this case, ending the game.
             self.end_round()
             return
+        #Displaying the LINE and BINGO messages of this round.
+        self.announce(*played)
+
+    #Defining a method that plays one round and updates the card and history widgets, without any popup.
+    def play_round(self, scroll=True):
+        """Draws a number and marks it. Returns (lines completed, bingo), or None once the game is over."""
+        #Checking if the rounds of the mode are used up.
+        if self.current_round >= self.rounds:
+            return None
+        #Playing the round on every card at once when several cards are played.
+        if self.hall is not None:
+            return self.play_hall_round(scroll)
+        #Drawing a number from the available pool and marking it on the card through the engine. 
+        outcome = self.engine.step()
+        #Checking if there are no numbers left to draw.
+        if outcome is None:
+            return None
+        #Storing the drawn number.
+        number = outcome.number
 
         #Incrementing the number of draws made by 1. 
         self.current_round += 1
         #Updating UI label to show the drawn number.
         self.drawn_label.config(text=str(number))
         #Adding the number to the visual scroll history.
-        self.update_drawn_history(number)
+        self.update_drawn_history(number, scroll)
 
         # Mark number on card
-        #Creating a loop through all card cell values (all rows and all numbers). 
-        for r, row in enumerate(self.card.grid):
-            for c, num in enumerate(row):
-                #Checking if the cell matches the drawn number.
-                if num == number:
-                    #In this case, changing its appearance to mark it visually. 
-                    self.card_labels[r][c].config(bg="#81c784", fg="white")
-                    #Recording this marked number logically. 
-                    self.marked.add(num)
-
-        #Checking whether the last draw completed a new horizontal/vertical line.
-        if self.check_line():
-            #In this case, displaying the LINE celebration message.
-            self.show_effect("LINE")
+        #Checking if the engine found the drawn number on the card.
+        if outcome.marked:
+            r, c = outcome.cell
+            #In this case, changing its appearance to mark it visually (one item update on the canvas).
+            if self.card_canvas is not None:
+                self.card_canvas.mark(0, (r, c))
+            else:
+                self.card_labels[r][c].config(bg=MARKED_BG, fg="white")
+
+        #Counting the lines completed by this draw, as reported by the card.
+        self.total_lines += outcome.new_lines
         #Checking whether the last draw completed the entire card (bingo).
-        if self.check_bingo():
+        if outcome.bingo:
             #In this case, marking the bingo achievement.
             self.bingo_achieved = True
+        return outcome.new_lines, self.bingo_achieved
+
+    #Defining a method that plays one round on every card of the hall.
+    def play_hall_round(self, scroll=True):
+        #Drawing a number from the available pool.
+        number = self.drawer.draw_number()
+        #Checking if there are no numbers left to draw.
+        if number is None:
+            return None
+        #Marking the number on every card holding it, found with a single index lookup.
+        hall_draw = self.hall.draw(number)
+        #Incrementing the number of draws made by 1 and showing the number.
+        self.current_round += 1
+        self.drawn_label.config(text=str(number))
+        self.update_drawn_history(number, scroll)
+        #Highlighting the number on every card with one canvas update.
+        if hall_draw.marked_cards.size:
+            self.card_canvas.mark_number(number)
+        #Counting the lines completed by this draw on any card.
+        new_lines = int(hall_draw.new_lines.sum())
+        self.total_lines += new_lines
+        #Recording whether one card is complete.
+        if hall_draw.bingo_cards.size:
+            self.bingo_achieved = True
+        return new_lines, self.bingo_achieved
+
+    #Defining a method that shows the popups of a round and ends the game on a bingo.
+    def announce(self, new_lines, bingo, lines_popup=True):
+        #Checking whether the round completed a new horizontal/vertical line.
+        if new_lines and lines_popup:
+            #In this case, displaying the LINE celebration message.
+            self.show_effect("LINE")
+        #Checking whether the round completed the entire card (bingo).
+        if bingo:
             #Displaying the BINGO celebration message.
             self.show_effect("BINGO")
             #Disabling drawing further because the game is over (win). 
@@ -439,57 +691,88 @@ class MiniBingoGUI(tk.Tk):
             #Showing the game summary and exiting. 
             self.end_round()
 
-    #Defining a method to determine if any new lines (row/columns) have been fully marked.
-    def check_line(self):
-        #Creating a flag to track whether a new line was found this draw.
-        new_line = False
-        #Storing the number of rows/columsn in the card (4x4).
-        size = self.card.size
-
-        # Check rows
-        #Creating a loop through each row.
-        for r in range(size):
-            #Checking if the row was already counted as completed.
-            if r in self.completed_lines:
-                #In this case, skipping it. 
-                continue
-            #Checking if every cell in this row is marked.
-            if all(self.card.grid[r][c] in self.marked for c in range(size)):
-                #In this case, registering this row as completed.
-                self.completed_lines.add(r)
-                #Indicating a new line was found.
-                new_line = True
-
-        # Check columns
-        #Creating a loop through each column.
-        for c in range(size):
-            #Assigning each column a unique ID (distinct from row ID).
-            col_id = c + size
-            #Checking if the column was already counted as completed.
-            if col_id in self.completed_lines:
-                #In this case, skipping it. 
-                continue
-            #Checking if every cell in this column is marked.
-            if all(self.card.grid[r][c] in self.marked for r in range(size)):
-                #In this case, registering this column as completed.
-                self.completed_lines.add(col_id)
-                #Indicating a new line was found.
-                new_line = True
-
-        #Returning whether any new completed line was found. 
-        return new_line
-
-    #Defining a method to check if all the numbers on the card have been marked. 
-    def check_bingo(self):
-        #Returning True only if every number in the card is marked.
-        return all(num in self.marked for num in self.card.get_card_numbers())
+    #Defining a method that starts, pauses or resumes the automatic draws.
+    def toggle_auto(self):
+        #Pausing if the automatic draws are running.
+        if self.auto_job is not None:
+            self.stop_auto()
+            self.auto_btn.config(text="Resume Auto")
+            self.draw_btn.config(state=tk.NORMAL)
+            return
+        #Ignoring the click while a manual draw is still being animated.
+        if self.drawing:
+            return
+        #Reading the interval (keeping the previous one if the field is not a number).
+        try:
+            self.auto_interval = max(1, self.interval_var.get())
+        except tk.TclError:
+            pass
+        #(Re)starting the clock the draws are paced against.
+        self.auto_started = time.perf_counter()
+        self.auto_done = 0
+        self.auto_btn.config(text="Pause Auto")
+        #Disabling manual draws while the automatic ones run.
+        self.draw_btn.config(state=tk.DISABLED)
+        self.auto_job = self.after(self.auto_interval, self.auto_tick)
+
+    #Defining a method that cancels the next automatic draw.
+    def stop_auto(self):
+        if self.auto_job is not None:
+            self.after_cancel(self.auto_job)
+            self.auto_job = None
+
+    #Defining a method that plays every automatic draw that is due, then schedules the next tick.
+    def auto_tick(self):
+        """Plays the draws due since the last tick in one batch, so a slow redraw never makes auto-play lag."""
+        self.auto_job = None
+        #Counting the draws due by now (at least one per tick).
+        due = int((time.perf_counter() - self.auto_started) * 1000 / self.auto_interval) - self.auto_done
+        new_lines, bingo, played = 0, False, None
+        for _ in range(max(1, due)):
+            played = self.play_round(scroll=False)
+            if played is None:
+                break
+            self.auto_done += 1
+            new_lines += played[0]
+            bingo = played[1]
+            if bingo:
+                break
+        #Scrolling the history once for the whole batch.
+        self.scroll_history()
+        #Ending the game when no round is left, or announcing the bingo (lines are only counted, no popups).
+        if played is None:
+            self.end_round()
+        elif bingo:
+            self.announce(new_lines, bingo, lines_popup=False)
+        else:
+            self.auto_job = self.after(self.auto_interval, self.auto_tick)
+
+    #Defining a method that plays every remaining round at once.
+    def skip_to_end(self):
+        """Resolves the remaining rounds without animation or popups and shows the summary."""
+        #Stopping the automatic draws and any animation in progress.
+        self.stop_auto()
+        if self._animation_job is not None:
+            self.after_cancel(self._animation_job)
+            self._animation_job = None
+        self.drawing = False
+        #Playing rounds until the bingo or the end of the game, scrolling the history once at the end.
+        played = self.play_round(scroll=False)
+        while played is not None and not played[1]:
+            played = self.play_round(scroll=False)
+        self.scroll_history()
+        self.end_round()
 
     #Defining a method to end the game (no more draws allowed). 
     def end_round(self):
         #Disabling draw button (so, no further interaction occurs).
         self.draw_btn.config(state=tk.DISABLED)
+        #Stopping and disabling the automatic draws.
+        self.stop_auto()
+        self.auto_btn.config(text="Auto Play", state=tk.DISABLED)
+        self.skip_btn.config(state=tk.DISABLED)
         #Creating a summary text for the final results pop-up. 
-        summary = f"Round summary:\n- Rounds played: {self.current_round}\n- Lines: {len(self.completed_lines)}\n- Bingo: {'Yes' if self.bingo_achieved else 'No'}"
+        summary = f"Round summary:\n- Rounds played: {self.current_round}\n- Lines: {self.total_lines}\n- Bingo: {'Yes' if self.bingo_achieved else 'No'}"
 
         #Creating the pop-up window to shor the resilts and the replay option. 
         replay_win = tk.Toplevel(self)
@@ -0,0 +1,107 @@
+import sqlite3
+from pathlib import Path
+
+#Naming the database file stored in the history directory.
+DB_NAME = "history.db"
+#Defining the mode stored for games recorded without a result; they count in the totals but not as a mode.
+NO_MODE = ""
+
+#Defining the schema: one row per game, plus one aggregate row and histogram per mode kept up to date on every write
+#(databases created by older versions also drop their unused index on games.mode).
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    mode TEXT NOT NULL,
+    rounds INTEGER,
+    played INTEGER,
+    won INTEGER NOT NULL,
+    lines INTEGER,
+    first_line INTEGER,
+    bingo INTEGER
+);
+CREATE TABLE IF NOT EXISTS mode_stats (
+    mode TEXT PRIMARY KEY,
+    games INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS round_histogram (
+    mode TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (mode, kind, round)
+);
+DROP INDEX IF EXISTS games_mode;
+"""
+
+#Defining the statement that adds one game to the aggregate row of its mode.
+UPSERT_MODE = """
+INSERT INTO mode_stats (mode, games, wins) VALUES (:mode, 1, :won)
+ON CONFLICT (mode) DO UPDATE SET games = games + 1, wins = wins + excluded.wins
+"""
+
+#Defining the statement that counts one game in the round histogram of its mode.
+UPSERT_ROUND = """
+INSERT INTO round_histogram (mode, kind, round, count) VALUES (?, ?, ?, 1)
+ON CONFLICT (mode, kind, round) DO UPDATE SET count = count + 1
+"""
+
+
+#Defining a class named SQLiteHistoryStore, which keeps the game history in a SQLite database.
+class SQLiteHistoryStore:
+    """SQLite storage for finished games, with per-mode aggregates maintained at write time."""
+
+    #Defining the constructor, opening (or creating) the database in the given directory.
+    def __init__(self, directory):
+        #Ensuring the directory exists before opening the database.
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self.path = Path(directory) / DB_NAME
+        #Opening the connection; it may be used from a background writer thread, one thread at a time.
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        #Using write-ahead logging, so readers never block the writer and commits stay cheap.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    #Defining a method that writes a batch of game records in a single transaction.
+    def write(self, records):
+        """Inserts the games and updates their mode aggregates, all in one transaction."""
+        #Filling in the fields missing from records of games without a result.
+        rows = [
+            {"mode": NO_MODE, "rounds": None, "played": None, "lines": None, "first_line": None, "bingo": None,
+             **record, "won": int(record["won"])}
+            for record in records
+        ]
+        #Committing the whole batch at once (the connection context manager rolls back on errors).
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO games (mode, rounds, played, won, lines, first_line, bingo) "
+                "VALUES (:mode, :rounds, :played, :won, :lines, :first_line, :bingo)",
+                rows,
+            )
+            self.conn.executemany(UPSERT_MODE, rows)
+            self.conn.executemany(UPSERT_ROUND, [
+                (row["mode"], kind, row[kind]) for row in rows for kind in ("bingo", "first_line")
+                if row[kind] and row["mode"] != NO_MODE
+            ])
+
+    #Defining a method returning the overall counts and per-mode histograms from the aggregate tables.
+    def totals(self, number_range: int = 99) -> dict:
+        """Returns games_played, wins, losses and, per mode, the game count and round histograms."""
+        games, wins = self.conn.execute("SELECT COALESCE(SUM(games), 0), COALESCE(SUM(wins), 0) FROM mode_stats").fetchone()
+        #Creating an empty histogram pair for every mode that has games (games without a mode only count in the totals).
+        modes = {
+            mode: {"games": count, "bingo": [0] * (number_range + 1), "first_line": [0] * (number_range + 1)}
+            for mode, count in self.conn.execute("SELECT mode, games FROM mode_stats WHERE mode != ?", (NO_MODE,))
+        }
+        #Filling the histograms from the aggregate table.
+        for mode, kind, round_number, count in self.conn.execute("SELECT mode, kind, round, count FROM round_histogram"):
+            histogram = modes[mode][kind]
+            if round_number >= len(histogram):
+                histogram.extend([0] * (round_number + 1 - len(histogram)))
+            histogram[round_number] = count
+        return {"games_played": games, "wins": wins, "losses": games - wins, "modes": modes}
+
+    #Defining a method that closes the database.
+    def close(self):
+        self.conn.close()
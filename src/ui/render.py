@@ -0,0 +1,90 @@
+import sys
+
+from game.card import BingoCard
+from game.draw import NumberDrawer
+from game.engine import DrawOutcome
+
+
+#Defining a class named ConsoleRenderer, which draws the console game one buffered frame at a time.
+#The start and end screens show everything; a round only shows its number and the card row it changed,
+#so the output of a game grows with its rounds instead of their square.
+class ConsoleRenderer:
+    """Builds every console frame into one string and writes it at once."""
+
+    #Defining the constructor, caching the text of the rules, the card and the drawn numbers.
+    def __init__(self, card: BingoCard, drawer: NumberDrawer, rules_text, out=None):
+        #Storing the card, the drawer and the stream the frames are written to.
+        self.card = card
+        self.drawer = drawer
+        self.out = out if out is not None else sys.stdout
+        #Formatting the rules block once (same layout as InfoTab.display()).
+        self.rules = "\n=== INFORMATION TAB ===\n\n" + "".join(f"{line}\n" for line in rules_text) + "=======================\n\n"
+        #Formatting every cell of the card and joining them into rows.
+        self.cells = [[self._format_cell(i, j) for j in range(card.size)] for i in range(card.size)]
+        self.rows = [" ".join(row) for row in self.cells]
+        self.separator = "-" * (card.size * 6)
+        self._card_text = None
+        #Storing the numbers drawn so far as text (usually none yet), joined only for the end screen.
+        self.drawn = [str(number) for number in drawer.drawn_numbers]
+
+    #Defining a helper method formatting a single cell, bracketed when it is marked.
+    def _format_cell(self, i: int, j: int) -> str:
+        num = self.card.grid[i][j]
+        return f"[{num:02}]" if self.card.marked[i][j] else f" {num:02} "
+
+    #Defining a property returning the card text, rebuilt only after a cell changed.
+    @property
+    def card_text(self) -> str:
+        if self._card_text is None:
+            self._card_text = "\n Your Bingo Card\n" + self.separator + "\n" + "\n".join(self.rows) + "\n" + self.separator + "\n"
+        return self._card_text
+
+    #Defining a method that re-formats the one cell a draw marked.
+    def mark(self, cell):
+        """Updates the cached text of the cell at (row, column) and of its row."""
+        i, j = cell
+        self.cells[i][j] = self._format_cell(i, j)
+        self.rows[i] = " ".join(self.cells[i])
+        self._card_text = None
+
+    #Defining a method that appends the new number to the drawn-number list.
+    def add_drawn(self, number: int):
+        self.drawn.append(str(number))
+
+    #Defining a property returning the drawn-number list as shown on the end screen.
+    @property
+    def drawn_text(self) -> str:
+        return ", ".join(self.drawn)
+
+    #Defining a method writing a whole frame with a single write.
+    def write(self, parts):
+        self.out.write("".join(parts))
+        self.out.flush()
+
+    #Defining a method that shows the rules and the card before the first draw.
+    def intro(self):
+        self.write([self.rules, self.card_text])
+
+    #Defining a method that updates the caches with a draw and shows only what it changed.
+    def round(self, outcome: DrawOutcome):
+        """Writes the frame of one round: the draw, the card row it marked, and any line or bingo."""
+        #Updating only what this draw changed.
+        if outcome.marked:
+            self.mark(outcome.cell)
+        self.add_drawn(outcome.number)
+        #Building the frame from the draw and, when it hit the card, the updated row.
+        parts = [f"➡️ Drawn number: {outcome.number}\n"]
+        if outcome.marked:
+            parts.append(f"Number found and marked on your card! Row {outcome.cell[0] + 1}: {self.rows[outcome.cell[0]]}\n")
+        else:
+            parts.append("Number not on your card.\n")
+        #Adding the announcements of the lines and the bingo.
+        if outcome.new_lines:
+            parts.append("🎉 LINE! You completed a row or column!\n")
+        if outcome.bingo:
+            parts.append("🏆 BINGO! You completed the entire card!\n")
+        self.write(parts)
+
+    #Defining a method that shows the end screen: the final card and every number drawn.
+    def finish(self):
+        self.write([self.card_text, "\n Numbers drawn so far:\n", (self.drawn_text or " No numbers drawn yet.") + "\n"])
@@ -0,0 +1,176 @@
+import curses
+import textwrap
+
+from game.card import BingoCard
+from game.draw import NumberDrawer
+from game.engine import GameEngine, mode_name
+from ui.display import InfoTab
+
+#Defining the number of drawn numbers shown per row of the board.
+BOARD_COLUMNS = 10
+#Defining the width of the rules panel (the rules are wrapped to fit it).
+RULES_WIDTH = 40
+
+
+#Defining a class named CursesBingo, the full-screen terminal front end.
+#Each draw only rewrites the cells it changed, with one doupdate() per draw, so high draw rates stay cheap.
+class CursesBingo:
+    """Full-screen curses front end: fixed windows for the card, last draw, drawn-number board and rules."""
+
+    #Defining the constructor, including the screen, the number of rounds and the auto-draw rate.
+    def __init__(self, stdscr, rounds: int = 99, rate: float = 0.0):
+        #Storing the screen, the number of rounds and the draws per second (0 = draw on key press).
+        self.stdscr = stdscr
+        self.rounds = rounds
+        self.rate = rate
+        #Creating a flag telling whether the automatic draws are paused.
+        self.paused = False
+        #Creating the rules text, wrapped to the width of its panel.
+        self.rules = [part for line in InfoTab().rules_text for part in textwrap.wrap(line, RULES_WIDTH - 4) or [""]]
+        #Creating placeholders for the current game (set by new_game()).
+        self.card = self.drawer = self.engine = None
+
+    #Defining a method that starts a new game and draws the whole screen once.
+    def new_game(self):
+        """Creates a new card, drawer and engine and lays out every window."""
+        #Creating the card, the drawer and the engine of the game.
+        self.card = BingoCard()
+        self.drawer = NumberDrawer(self.card.number_range)
+        self.engine = GameEngine(self.card, self.drawer, self.rounds)
+        #Laying out the windows.
+        self._layout()
+        #Drawing the static content of every window once.
+        self.stdscr.erase()
+        self.stdscr.addstr(0, 0, f"MINI BINGO - {mode_name(self.rounds)} ({self.rounds} rounds)", curses.A_BOLD)
+        self.stdscr.noutrefresh()
+        for i in range(self.card.size):
+            for j in range(self.card.size):
+                self._draw_cell(i, j)
+        for number in range(1, self.card.number_range + 1):
+            self._draw_board(number)
+        for row, line in enumerate(self.rules, 1):
+            self.rules_win.addstr(row, 2, line)
+        self._draw_status("-")
+        self.message(self._help())
+        for win in (self.card_win, self.status_win, self.board_win, self.rules_win):
+            win.noutrefresh()
+        curses.doupdate()
+
+    #Defining a helper method that creates the windows at fixed positions.
+    def _layout(self):
+        size, number_range = self.card.size, self.card.number_range
+        #Computing the size of every window.
+        card_h, card_w = size + 2, size * 5 + 3
+        board_h, board_w = -(-number_range // BOARD_COLUMNS) + 2, BOARD_COLUMNS * 3 + 3
+        rules_h = len(self.rules) + 2
+        #Checking that the screen can hold every window.
+        height, width = self.stdscr.getmaxyx()
+        need_h, need_w = 1 + card_h + max(board_h, rules_h) + 1, max(card_w + 25, board_w + 1 + RULES_WIDTH)
+        if height < need_h or width < need_w:
+            raise RuntimeError(f"The terminal must be at least {need_w}x{need_h} (it is {width}x{height}).")
+        #Creating the card and status windows on top, the board and rules below, and a message line at the bottom.
+        self.card_win = curses.newwin(card_h, card_w, 1, 0)
+        self.status_win = curses.newwin(card_h, 24, 1, card_w + 1)
+        self.board_win = curses.newwin(board_h, board_w, 1 + card_h, 0)
+        self.rules_win = curses.newwin(rules_h, RULES_WIDTH, 1 + card_h, board_w + 1)
+        self.message_win = curses.newwin(1, need_w, need_h - 1, 0)
+        for win, title in ((self.card_win, "Card"), (self.status_win, "Last draw"),
+                           (self.board_win, "Drawn numbers"), (self.rules_win, "Rules")):
+            win.box()
+            win.addstr(0, 2, f" {title} ")
+
+    #Defining a helper method that writes one cell of the card.
+    def _draw_cell(self, i: int, j: int):
+        marked = self.card.marked[i][j]
+        self.card_win.addstr(1 + i, 2 + j * 5, f"[{self.card.grid[i][j]:02}]" if marked else f" {self.card.grid[i][j]:02} ",
+                             curses.A_REVERSE if marked else curses.A_NORMAL)
+
+    #Defining a helper method that writes one number of the board, highlighted once drawn.
+    def _draw_board(self, number: int, drawn: bool = False):
+        row, col = divmod(number - 1, BOARD_COLUMNS)
+        self.board_win.addstr(1 + row, 2 + col * 3, f"{number:2}", curses.A_REVERSE if drawn else curses.A_DIM)
+
+    #Defining a helper method that rewrites the status window.
+    def _draw_status(self, number, note: str = ""):
+        self.status_win.addstr(1, 2, f"Number: {number:>3}")
+        self.status_win.addstr(2, 2, f"Round:  {self.engine.current_round:>3}/{self.rounds}")
+        self.status_win.addstr(3, 2, f"Lines:  {self.engine.lines:>3}")
+        self.status_win.addstr(4, 2, f"{note:<20}"[:20])
+
+    #Defining a helper method that replaces the message line.
+    def message(self, text: str):
+        self.message_win.erase()
+        self.message_win.addstr(0, 0, text[:self.message_win.getmaxyx()[1] - 1])
+        self.message_win.noutrefresh()
+
+    #Defining a helper method returning the key help shown while playing.
+    def _help(self) -> str:
+        if self.rate:
+            return "p: pause/resume   space: draw   q: quit"
+        return "space/enter: draw   q: quit"
+
+    #Defining a method that plays one round and refreshes only what it changed.
+    def draw(self):
+        """Draws one number; returns the outcome, or None once the game is over."""
+        outcome = self.engine.step()
+        if outcome is None:
+            return None
+        #Rewriting the marked cell, the board entry and the status.
+        if outcome.marked:
+            self._draw_cell(*outcome.cell)
+            self.card_win.noutrefresh()
+        self._draw_board(outcome.number, drawn=True)
+        self.board_win.noutrefresh()
+        self._draw_status(outcome.number, "BINGO!" if outcome.bingo else "LINE!" if outcome.new_lines else "")
+        self.status_win.noutrefresh()
+        #Updating the terminal once for every window changed by this draw.
+        curses.doupdate()
+        return outcome
+
+    #Defining a method that plays a game until it ends or the player quits.
+    def play(self):
+        """Plays one game; returns its GameResult, or None if the player quit before the end."""
+        self.new_game()
+        #Waiting for keys forever in manual mode, or for one draw interval in auto mode.
+        self.stdscr.timeout(int(1000 / self.rate) if self.rate else -1)
+        while not self.engine.finished:
+            key = self.stdscr.getch()
+            if key in (ord("q"), ord("Q")):
+                return None
+            if key in (ord("p"), ord("P")) and self.rate:
+                self.paused = not self.paused
+                self.message("Paused - p: resume   q: quit" if self.paused else self._help())
+                curses.doupdate()
+            #Drawing on a key press, or when the interval passed without a key in auto mode.
+            elif key in (ord(" "), ord("\n"), curses.KEY_ENTER) or (key == -1 and self.rate and not self.paused):
+                if self.draw() is None:
+                    break
+        return self.engine.result()
+
+
+#Defining a function that runs games on the full screen until the player quits.
+def play_curses(stdscr, rounds: int = 99, rate: float = 0.0, history=None):
+    """curses.wrapper() entry point: plays games and records each finished one in the history."""
+    #Hiding the cursor where the terminal allows it.
+    try:
+        curses.curs_set(0)
+    except curses.error:
+        pass
+    ui = CursesBingo(stdscr, rounds, rate)
+    while True:
+        result = ui.play()
+        #Leaving when the player quit in the middle of a game.
+        if result is None:
+            return
+        #Recording the finished game.
+        if history is not None:
+            history.update_history(result.won, result)
+        #Announcing the result and waiting for the player's choice.
+        ui.message(("BINGO! You won" if result.won else "Game over") + f" in {result.rounds_played} rounds - n: new game   q: quit")
+        curses.doupdate()
+        ui.stdscr.timeout(-1)
+        key = ui.stdscr.getch()
+        while key not in (ord("n"), ord("N"), ord("q"), ord("Q")):
+            key = ui.stdscr.getch()
+        if key in (ord("q"), ord("Q")):
+            return
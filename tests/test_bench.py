@@ -0,0 +1,19 @@
+import pytest
+from benchmarks.bench_core import compare, run_benchmarks
+
+#Defining a test function to verify the benchmark suite runs and reports every benchmark.
+def test_benchmarks_report_every_parameter():
+    """A tiny run must time every card benchmark and the hall benchmarks."""
+    #Running one quick round of every benchmark.
+    results = run_benchmarks(sizes=[4], ranges=[99], halls=[50], repeat=1, min_time=0)
+    #Failing the test if a benchmark is missing or has no positive time.
+    assert "full_game[size=4,range=99]" in results and "hall_draw[cards=50]" in results
+    assert all(result["seconds_per_op"] > 0 for result in results.values())
+
+#Defining a test function to verify regressions are flagged against a baseline.
+def test_compare_flags_regressions():
+    """Only benchmarks slower than the baseline by more than the threshold are regressions."""
+    baseline = {"a": {"seconds_per_op": 1.0}, "b": {"seconds_per_op": 1.0}, "gone": {"seconds_per_op": 1.0}}
+    results = {"a": {"seconds_per_op": 1.05}, "b": {"seconds_per_op": 1.5}, "new": {"seconds_per_op": 1.0}}
+    #Failing the test if the 5% slowdown is flagged, the 50% one is not, or unmatched names are compared.
+    assert [(name, regressed) for name, _, _, _, regressed in compare(results, baseline, 0.10)] == [("a", False), ("b", True)]
@@ -1,5 +1,7 @@
+import copy
+import pickle
 import pytest
-from src.game.card import BingoCard
+from src.game.card import BingoCard, CompactBingoCard
 
 #Defining a test function to check that the card contains 16 numbers.
 def test_card_has_16_numbers():
@@ -122,3 +124,38 @@ def test_display_card_shows_marked_numbers(capsys):
     captured = capsys.readouterr()
     #Failing the test if the marked number doesn't appear surrounded by brackets [ ].
     assert "[" in captured.out and "]" in captured.out, "Marked numbers not displayed properly"
+
+#Defining a test function to check that the position index matches the grid.
+def test_positions_index_matches_grid():
+    """positions should map every card number to its (row, column) in the grid."""
+    #Creating a new bingo card instance.
+    card = BingoCard()
+    #Failing the test if the index does not hold one entry per cell.
+    assert len(card.positions) == card.size ** 2, "Position index is incomplete"
+    #Creating a loop through every indexed number and its position.
+    for number, (i, j) in card.positions.items():
+        #Failing the test if the indexed cell does not hold the number.
+        assert card.grid[i][j] == number, "Position index points at the wrong cell"
+    #Failing the test if find_number() reports a position for a number not on the card.
+    assert card.find_number(200) is None, "Missing number should have no position"
+
+#Defining a test function to check that cards survive pickling and copying with their marks and counters.
+@pytest.mark.parametrize("card_class", [BingoCard, CompactBingoCard])
+def test_card_pickle_round_trip(card_class):
+    #Creating a card with the default generator and marking its first row.
+    card = card_class()
+    for number in card.grid[0]:
+        card.mark_number(number)
+    #Pickling and deep-copying the card.
+    for clone in (pickle.loads(pickle.dumps(card)), copy.deepcopy(card)):
+        #Failing the test if the clone has a different grid or marks.
+        assert clone.grid == card.grid
+        assert [list(row) for row in clone.marked] == [list(row) for row in card.marked]
+        #Failing the test if the clone's line and bingo checks do not follow its own marks.
+        assert clone.check_line()
+        assert not clone.check_bingo()
+        for number in clone.get_card_numbers():
+            clone.mark_number(number)
+        assert clone.check_bingo()
+    #Failing the test if marking the clones changed the original card.
+    assert not card.check_bingo()
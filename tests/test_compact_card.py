@@ -0,0 +1,52 @@
+import pytest
+from src.game.card import CompactBingoCard
+
+#Defining a test function to verify that marking a number sets the matching bit.
+def test_mark_number_sets_bit():
+    """mark_number() should set exactly the bit of the matching cell."""
+    #Creating a new compact bingo card instance.
+    card = CompactBingoCard()
+    #Marking the number in the second row, first column.
+    card.mark_number(card.grid[1][0])
+    #Failing the test if the bitmask does not hold exactly that cell.
+    assert card.mask == 1 << card.size
+    #Failing the test if the matrix view does not show the mark.
+    assert card.marked[1][0] and card.marked_count == 1
+
+#Defining a test function to verify that writes through the marked view reach the bitmask.
+def test_marked_view_writes_bitmask():
+    """Assigning rows and cells through marked should behave like the list-of-lists card."""
+    #Creating a new compact bingo card instance.
+    card = CompactBingoCard()
+    #Manually marking the entire first row through the view.
+    card.marked[0] = [True, True, True, True]
+    #Failing the test if the line is not detected once, and only once.
+    assert card.check_line() == True
+    assert card.check_line() == False
+    #Failing the test if the view does not compare equal to the expected matrix.
+    assert card.marked == [[True] * 4] + [[False] * 4 for _ in range(3)]
+
+#Defining a test function to verify that diagonals only count when enabled.
+def test_diagonals_are_optional():
+    """A marked diagonal is a line only when the card was created with diagonals=True."""
+    #Creating one card without and one card with diagonal lines.
+    plain = CompactBingoCard()
+    diagonal = CompactBingoCard(diagonals=True)
+    #Creating a loop over the grid indices to mark the main diagonal on both cards.
+    for i in range(4):
+        plain.marked[i][i] = True
+        diagonal.marked[i][i] = True
+    #Failing the test if the diagonal is counted on the plain card, or missed on the diagonal card.
+    assert plain.check_line() == False
+    assert diagonal.check_line() == True
+
+#Defining a test function to verify bingo detection with the full mask.
+def test_check_bingo_full_mask():
+    """Marking every number should make the bitmask equal to the full mask."""
+    #Creating a new compact bingo card instance.
+    card = CompactBingoCard()
+    #Marking every number on the card.
+    for number in card.get_card_numbers():
+        card.mark_number(number)
+    #Failing the test if bingo is not detected.
+    assert card.check_bingo() == True
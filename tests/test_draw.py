@@ -1,4 +1,7 @@
+import copy
+import pickle
 import pytest
+import random
 from src.game.draw import NumberDrawer
 
 #Defining a test function to ensure that the drawn numbers are within the valid limits. 
@@ -53,3 +56,56 @@ def test_draw_after_exhaustion_returns_none():
     #Failing the test if it doesn't return None (should confirm that there are no numbers remaining).
     assert drawer.draw_number() is None, "After all draws, should return None"
 
+
+#Defining a test function to check that a seeded generator makes the draw order reproducible.
+def test_seeded_drawers_draw_same_sequence():
+    #Creating two drawers with generators seeded identically.
+    drawer1 = NumberDrawer(rng=random.Random(7))
+    drawer2 = NumberDrawer(rng=random.Random(7))
+    #Drawing every number from both drawers.
+    for _ in range(99):
+        drawer1.draw_number()
+        drawer2.draw_number()
+    #Failing the test if the two sequences differ.
+    assert drawer1.drawn_numbers == drawer2.drawn_numbers
+    #Failing the test if the available set is not empty after every number was drawn.
+    assert drawer1.available_numbers == set()
+
+#Defining a test function to check that the lazy mode draws every number exactly once.
+def test_lazy_drawer_draws_full_range_without_repetition():
+    #Creating a lazy drawer over a small range so it can be exhausted.
+    drawer = NumberDrawer(max_number=500, lazy=True)
+    #Drawing every number in the range.
+    drawn = [drawer.draw_number() for _ in range(500)]
+    #Failing the test if the numbers are not exactly 1 to 500.
+    assert sorted(drawn) == list(range(1, 501))
+    #Failing the test if the drawer does not report exhaustion afterwards.
+    assert drawer.draw_number() is None
+
+#Defining a test function to check that the lazy mode keeps memory proportional to the draws.
+def test_lazy_drawer_memory_grows_with_draws():
+    #Creating a drawer over a huge range (lazy mode is chosen automatically).
+    drawer = NumberDrawer(max_number=10 ** 9)
+    #Drawing a few numbers.
+    for _ in range(100):
+        drawer.draw_number()
+    #Failing the test if the drawer is not lazy, or stores more than one entry per draw.
+    assert drawer.lazy
+    assert len(drawer._swaps) <= 100
+    #Failing the test if a number was repeated or falls outside the range.
+    assert len(set(drawer.drawn_numbers)) == 100
+    assert all(1 <= n <= 10 ** 9 for n in drawer.drawn_numbers)
+
+#Defining a test function to check that drawers survive pickling and copying (e.g. to be sent to worker processes).
+@pytest.mark.parametrize("lazy", [False, True])
+def test_drawer_pickle_round_trip(lazy):
+    #Creating a drawer with the default generator and drawing a few numbers.
+    drawer = NumberDrawer(lazy=lazy)
+    for _ in range(10):
+        drawer.draw_number()
+    #Pickling and deep-copying the drawer.
+    for clone in (pickle.loads(pickle.dumps(drawer)), copy.deepcopy(drawer)):
+        #Failing the test if the clone lost the drawn numbers, or draws one of them again.
+        assert clone.drawn_numbers == drawer.drawn_numbers
+        assert clone.remaining == drawer.remaining
+        assert clone.draw_number() not in drawer.drawn_numbers
@@ -1,4 +1,7 @@
+import io
+from src.game.engine import GameEngine
 from src.ui.display import MiniBingo
+from src.ui.render import ConsoleRenderer
 
 #Defining a test function to verify that a drawn number that exists on the card gets marked. 
 def test_draw_marks_card():
@@ -24,3 +27,30 @@ def test_mark_number_not_on_card():
     #Failing the test if any number has been marked (as the picked number was not valid).
     assert not any(any(row) for row in game.card.marked), \
         "No marks should occur for a number not on the card"
+
+#Defining a test function to verify that the renderer's cached card matches display_card().
+def test_renderer_matches_display_card(capsys):
+    """After a few draws, the incrementally updated card text must equal a full re-render."""
+    #Creating a game and a renderer writing to a buffer.
+    game = MiniBingo()
+    out = io.StringIO()
+    renderer = ConsoleRenderer(game.card, game.drawer, game.info.rules_text, out=out)
+    engine = GameEngine(game.card, game.drawer, 99)
+    #Playing every round through the renderer.
+    outcome = engine.step()
+    frames = []
+    while outcome is not None:
+        start = out.tell()
+        renderer.round(outcome)
+        frames.append(len(out.getvalue()) - start)
+        outcome = engine.step()
+    #Failing the test if a round repeats the card or the drawn list (its output must not grow with the rounds).
+    assert max(frames) < 200
+    #Failing the test if the end screen does not show the final card and every drawn number.
+    renderer.finish()
+    assert out.getvalue().endswith(renderer.card_text + "\n Numbers drawn so far:\n" + renderer.drawn_text + "\n")
+    #Failing the test if the cached card differs from the full display.
+    game.card.display_card()
+    assert renderer.card_text == capsys.readouterr().out
+    #Failing the test if the drawn-number list was not appended in draw order.
+    assert renderer.drawn_text == ", ".join(map(str, game.drawer.drawn_numbers))
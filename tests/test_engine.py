@@ -0,0 +1,60 @@
+import random
+import pytest
+from src.game.card import BingoCard
+from src.game.draw import NumberDrawer
+from src.game.engine import GameEngine, play_game
+
+#Defining a test function to verify that a full-length game always ends in bingo.
+def test_full_game_always_wins():
+    """With 99 rounds on 1-99 every number is drawn, so the card must be completed."""
+    #Playing one headless game with every round available.
+    result = play_game(99)
+    #Failing the test if the game was not won, or the bingo round is not the last round played.
+    assert result.won
+    assert result.bingo_round == result.rounds_played
+    #Failing the test if fewer than the 8 rows and columns were completed.
+    assert result.lines == 8
+
+#Defining a test function to verify that the engine respects the round limit.
+def test_engine_stops_at_round_limit():
+    """A game cannot play more rounds than its mode allows."""
+    #Playing one headless game limited to 10 rounds.
+    result = play_game(10)
+    #Failing the test if more than 10 numbers were drawn, or the game is reported as won.
+    assert result.rounds_played == 10 == len(result.draws)
+    assert not result.won
+
+#Defining a test function to verify that each step reports the marked cell.
+def test_step_reports_marked_cell():
+    """step() should report the cell of a drawn number that is on the card."""
+    #Creating a card and a drawer whose first draw is the card's first number.
+    card = BingoCard()
+    drawer = NumberDrawer()
+    drawer.draw_number = lambda: card.grid[0][0]
+    #Playing one round through the engine.
+    outcome = GameEngine(card, drawer, rounds=5).step()
+    #Failing the test if the outcome does not point to the top-left cell, or the card was not marked.
+    assert outcome.cell == (0, 0) and outcome.marked
+    assert card.marked[0][0]
+    #Failing the test if the outcome does not carry the drawn number and its round.
+    assert outcome.number == card.grid[0][0] and outcome.round_number == 1
+
+#Defining a test function to verify that seeded games are reproducible.
+def test_seeded_games_are_reproducible():
+    """Two games with the same card and draw seed must produce the same result."""
+    #Creating two copies of the same card and two identically seeded drawers.
+    card1, card2 = BingoCard(), BingoCard()
+    card2.grid, card2.positions = card1.grid, card1.positions
+    result1 = play_game(99, card1, NumberDrawer(rng=random.Random(3)))
+    result2 = play_game(99, card2, NumberDrawer(rng=random.Random(3)))
+    #Failing the test if the two results differ.
+    assert result1 == result2
+
+#Defining a test function to verify that the command line rejects empty runs of games.
+@pytest.mark.parametrize("option", ["--games", "--simulate"])
+def test_cli_rejects_zero_games(option):
+    """--games 0 and --simulate 0 must be rejected instead of crashing or starting an interactive session."""
+    from src.main import parse_args
+    with pytest.raises(SystemExit):
+        parse_args([option, "0"])
+    assert parse_args(["--simulate", "5"]).simulate == 5
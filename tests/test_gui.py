@@ -1,4 +1,5 @@
 import pytest
+import time
 import tkinter as tk
 from unittest.mock import MagicMock, patch
 
@@ -40,8 +41,8 @@ def test_start_game_creates_card_and_drawer(app):
     assert app.drawer is not None
     assert app.current_round == 0
     #All tracking variables must be reset
-    assert len(app.marked) == 0
-    assert len(app.completed_lines) == 0
+    assert app.total_lines == 0
+    assert app.card.marked_count == 0
     #Card grid must be fully created
     assert len(app.card_labels) == app.card.size
 
@@ -59,6 +60,18 @@ def test_display_card_creates_grid(app):
         for cell in row:
             assert isinstance(cell, tk.Label)
 
+def test_display_card_reuses_labels(app):
+    """A new game with the same card size must re-text the existing labels, not rebuild them."""
+    app.rounds = 10
+    app.start_game()
+    labels = [lbl for row in app.card_labels for lbl in row]
+    app.card_labels[0][0].config(bg="#81c784")
+    app.start_game()
+    #Same widgets, showing the new card with the unmarked colors
+    assert [lbl for row in app.card_labels for lbl in row] == labels
+    assert app.card_labels[0][0]["text"] == str(app.card.grid[0][0])
+    assert app.card_labels[0][0]["bg"] == "#ffffff"
+
 def test_update_drawn_history_adds_label(app):
     """A drawn number must be appended to the drawn-number history panel."""
     app.rounds = 10
@@ -69,14 +82,26 @@ def test_update_drawn_history_adds_label(app):
     assert len(app.drawn_history_labels) == 1
     assert app.drawn_history_labels[0]["text"] == "42"
 
+def test_drawn_history_reuses_labels(app):
+    """A replay must blank and reuse the history labels instead of creating new ones."""
+    app.rounds = 10
+    app.start_game()
+    app.update_drawn_history(7)
+    pool = list(app.history_pool)
+    #Start a new game: the same labels are kept, and none is in use
+    app.start_game()
+    assert app.history_pool == pool
+    assert app.drawn_history_labels == []
+    assert pool[0]["text"] == ""
+
 def test_draw_number_marks_card(app, monkeypatch):
     """
     When a drawn number matches a cell:
-    - It must be added to the marked set.
+    - It must be marked on the card.
     - Its corresponding label must update its background color.
     """
-    #Skip roulette animation to speed up test
-    monkeypatch.setattr(app, "roulette_animation", lambda: None)
+    #Reveal the number without any roulette frames
+    app.animation_steps = 0
     app.rounds = 5
     app.start_game()
     #Deterministic draw result
@@ -85,48 +110,107 @@ def test_draw_number_marks_card(app, monkeypatch):
 
     app.draw_number()
     #Verify correct marking
-    assert known_number in app.marked
+    assert app.card.marked[0][0]
     assert app.card_labels[0][0]["bg"] == "#81c784"
 
-def test_check_line_detects_rows(app):
-    """check_line must detect and record a fully marked row."""
+def test_draw_number_ignores_overlapping_clicks(app):
+    """A click while the roulette is still running must not start a second draw."""
     app.rounds = 5
     app.start_game()
-    #Simulate a full row marking
-    row_nums = app.card.grid[0]
-    app.marked = set(row_nums)
+    #First click starts the animation (frames are scheduled, not run)
+    app.draw_number()
+    app.draw_number()
+    assert app.drawing is True
+    assert app.drawer.drawn_numbers == []
+    #A new game cancels the pending animation
+    app.start_game()
+    assert app.drawing is False
 
-    assert app.check_line() is True
-    assert 0 in app.completed_lines #Row index is stored
+def test_canvas_renderer_marks_cell(monkeypatch):
+    """With the canvas renderer, a matching draw recolors the cell item instead of a label."""
+    monkeypatch.setattr(MiniBingoGUI, "show_intro", lambda self: None)
+    app = MiniBingoGUI(animation_steps=0, use_canvas=True)
+    try:
+        app.rounds = 5
+        app.start_game()
+        #No per-cell widgets: one rectangle item per cell
+        assert app.card_labels == []
+        assert len(app.card_canvas.find_withtag("cell")) == app.card.size ** 2
+        known_number = app.card.grid[1][2]
+        app.drawer.draw_number = MagicMock(return_value=known_number)
+        app.draw_number()
+        assert app.card_canvas.cell_color(0, (1, 2)) == "#81c784"
+    finally:
+        app.destroy()
+
+def test_multi_card_draw_highlights_every_card(monkeypatch):
+    """With several cards, one draw marks the number on every card holding it."""
+    monkeypatch.setattr(MiniBingoGUI, "show_intro", lambda self: None)
+    app = MiniBingoGUI(animation_steps=0, n_cards=12)
+    try:
+        app.rounds = 5
+        app.start_game()
+        assert len(app.cards) == 12
+        #Draw a number held by the first card
+        known_number = app.cards[0].grid[0][0]
+        app.drawer.draw_number = MagicMock(return_value=known_number)
+        app.draw_number()
+        #Every card holding it is marked, in the model and on the canvas
+        for k, card in enumerate(app.cards):
+            cell = card.find_number(known_number)
+            if cell is not None:
+                assert card.marked[cell[0]][cell[1]]
+                assert app.card_canvas.cell_color(k, cell) == "#81c784"
+    finally:
+        app.destroy()
+
+def test_skip_to_end_finishes_game(app):
+    """skip_to_end must play the remaining rounds at once and show only the summary."""
+    app.rounds = 99
+    app.start_game()
+    with patch("tkinter.Toplevel") as mock_top:
+        app.skip_to_end()
+    #Easy mode always ends with a bingo; only the summary popup is created
+    assert app.bingo_achieved is True
+    assert mock_top.call_count == 1
+    assert app.draw_btn["state"] == tk.DISABLED
 
-def test_check_line_detects_columns(app):
-    """check_line must detect and record a fully marked column."""
-    app.rounds = 5
+def test_auto_tick_plays_due_draws(app):
+    """An auto tick that is late plays every draw due since the start in one batch."""
+    app.rounds = 99
     app.start_game()
-    #Mark entire first column
-    col_nums = [app.card.grid[r][0] for r in range(app.card.size)]
-    app.marked = set(col_nums)
-    #Column indices follow rows, so first column index = size
-    assert app.check_line() is True
-    assert app.card.size in app.completed_lines
-
-def test_check_bingo_true(app):
-    """check_bingo must return True when all card numbers are marked."""
-    app.rounds = 5
+    app.auto_interval = 10
+    #Pretend the auto-play started 50 ms ago
+    app.auto_started = time.perf_counter() - 0.05
+    app.auto_done = 0
+    app.auto_tick()
+    assert app.current_round >= 5
+    app.stop_auto()
+
+def test_gui_counts_lines_from_card_events(app):
+    """The GUI line and bingo state must come from the card's mark events."""
+    app.rounds = 99
     app.start_game()
-    #Mark entire card
-    all_nums = app.card.get_card_numbers()
-    app.marked = set(all_nums)
-
-    assert app.check_bingo() is True
-
-def test_check_bingo_false(app):
-    """check_bingo must return False when the card is not fully marked."""
-    app.rounds = 5
+    #Draw the first row: the last number completes one line
+    row = list(app.card.grid[0])
+    app.drawer.draw_number = MagicMock(side_effect=row)
+    for _ in row:
+        lines, bingo = app.play_round()
+    assert (lines, bingo) == (1, False)
+    assert app.total_lines == 1
+    assert app.card.line_rows_announced[0]
+
+def test_gui_bingo_from_card_events(app):
+    """Drawing every number of the card must set the bingo flag."""
+    app.rounds = 99
     app.start_game()
-
-    app.marked = set() #No marks
-    assert not app.check_bingo()
+    numbers = app.card.get_card_numbers()
+    app.drawer.draw_number = MagicMock(side_effect=numbers)
+    for _ in numbers:
+        lines, bingo = app.play_round()
+    assert bingo is True and app.bingo_achieved
+    #A full card holds every row and every column
+    assert app.total_lines == 2 * app.card.size
 
 def test_show_rules_creates_popup(app):
     """show_rules must create a new Toplevel window."""
@@ -154,3 +238,17 @@ def test_end_round_disables_button(app):
         app.end_round()
     #Draw button must be disabled after round finishes
     assert app.draw_btn["state"] == tk.DISABLED
+
+def test_many_cards_are_scrollable(monkeypatch):
+    """A page of cards taller than the canvas is capped to its max height and gets a scrollbar."""
+    monkeypatch.setattr(MiniBingoGUI, "show_intro", lambda self: None)
+    app = MiniBingoGUI(animation_steps=0, n_cards=60)
+    try:
+        app.rounds = 5
+        app.start_game()
+        canvas = app.card_canvas
+        assert canvas.page_height > canvas.max_height
+        assert int(canvas.cget("height")) == canvas.max_height
+        assert app.card_scrollbar.winfo_manager() == "pack"
+    finally:
+        app.destroy()
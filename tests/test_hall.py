@@ -0,0 +1,109 @@
+import pytest
+from src.game.card import BingoCard
+import numpy as np
+from src.game.hall import CardHall, resolve_win_rounds
+
+#Defining a test function to check that every generated card is valid.
+def test_hall_cards_are_valid():
+    """Every card of the hall must hold 16 unique numbers between 1 and 99."""
+    #Creating a hall of cards.
+    hall = CardHall(500, seed=1)
+    #Failing the test if the grids do not have the expected shape.
+    assert hall.grids.shape == (500, 4, 4)
+    #Creating a loop through a few cards and validating each one as a BingoCard.
+    for index in range(0, 500, 50):
+        assert hall.card(index).validate_card(), "Hall card is not valid"
+
+#Defining a test function to check that hall draws agree with individual BingoCard objects.
+def test_hall_draws_match_bingo_cards():
+    """Drawing on the hall must mark, line and complete the same cards as marking each BingoCard."""
+    #Creating a few ordinary cards and a hall holding the same grids.
+    cards = [BingoCard() for _ in range(30)]
+    hall = CardHall.from_cards(cards)
+    #Creating a loop through every number in a fixed order.
+    for number in range(1, 100):
+        result = hall.draw(number)
+        #Marking every ordinary card and collecting which ones hit and which ones completed the bingo.
+        hits = [i for i, card in enumerate(cards) if card.mark_number(number)]
+        bingos = [i for i in hits if cards[i].check_bingo()]
+        #Failing the test if the hall marked different cards.
+        assert result.marked_cards.tolist() == hits
+        assert set(result.bingo_cards.tolist()) == set(bingos)
+    #Failing the test if some card is not complete, or did not count its 8 lines.
+    assert hall.bingo.all() and (hall.lines == 8).all()
+
+#Defining a test function to check that a card view reads and writes the hall.
+def test_card_view_shares_hall_marks():
+    """Marks written through a card view must appear in the hall, and hall draws in the view."""
+    #Creating a hall and a view of its first card.
+    hall = CardHall(3, seed=2)
+    view = hall.card(0)
+    #Marking the first row through the view.
+    view.marked[0] = [True, True, True, True]
+    #Failing the test if the hall does not see the marks, or the view does not detect the line.
+    assert hall.marks[0, 0].all()
+    assert view.check_line() == True
+    assert hall.lines[0] == 1
+    #Drawing the rest of the card on the hall.
+    for number in view.get_card_numbers():
+        hall.draw(number)
+    #Failing the test if the view does not report the bingo.
+    assert view.check_bingo() == True
+    #Failing the test if the line announced through the view is missing from the hall's counters.
+    assert hall.lines[0] == 8 and hall.bingo[0]
+
+#Defining a test function to check the inverted index against the grids.
+def test_cells_for_matches_grids():
+    """cells_for() must list exactly the cards and cells holding each number."""
+    #Creating a hall of cards.
+    hall = CardHall(200, seed=3)
+    #Creating a loop through every number in the range.
+    for number in range(1, 100):
+        cards, cells = hall.cells_for(number)
+        #Failing the test if an indexed cell does not hold the number.
+        assert (hall.grids.reshape(200, -1)[cards, cells] == number).all()
+        #Failing the test if the index misses a card holding the number.
+        assert len(cards) == int((hall.grids == number).sum())
+
+#Defining a test function to check the vectorized winning rounds against a replay of the game.
+def test_resolve_matches_replay():
+    """resolve() must give each card the rounds at which replaying the draws yields its first line and bingo."""
+    #Creating a hall and a full random draw order.
+    hall = CardHall(300, seed=4)
+    draws = np.random.default_rng(5).permutation(np.arange(1, 100))
+    #Resolving every card at once.
+    first_line, bingo = hall.resolve(draws)
+    #Replaying the draws one by one and recording the first round each card lines and completes.
+    replay_line = np.zeros(300, dtype=int)
+    replay_bingo = np.zeros(300, dtype=int)
+    for round_number, number in enumerate(draws, 1):
+        result = hall.draw(int(number))
+        replay_line[result.line_cards[replay_line[result.line_cards] == 0]] = round_number
+        replay_bingo[result.bingo_cards] = round_number
+    #Failing the test if the resolved rounds differ from the replay.
+    assert (first_line == replay_line).all()
+    assert (bingo == replay_bingo).all()
+    #Failing the test if a short draw sequence reports a bingo that cannot have happened.
+    assert (resolve_win_rounds(draws[:10], hall.grids)[1] == 0).all()
+
+#Defining a test function to check the cards of halls with small and huge number ranges.
+@pytest.mark.parametrize("number_range", [20, 10 ** 6])
+def test_hall_cards_valid_for_small_and_huge_ranges(number_range):
+    """Cards are valid both when sampled from per-number keys (small ranges) and by redrawing repeats (huge ranges)."""
+    hall = CardHall(500, number_range=number_range, seed=3)
+    flat = hall.grids.reshape(len(hall), -1)
+    assert flat.min() >= 1 and flat.max() <= number_range
+    assert all(len(set(row)) == flat.shape[1] for row in flat.tolist())
+    #The same seed gives the same cards
+    assert (CardHall(500, number_range=number_range, seed=3).grids == hall.grids).all()
+
+#Defining a test function to check the inputs accepted by resolve_win_rounds().
+def test_resolve_accepts_card_generators_and_large_numbers():
+    """Cards can come from a generator, and drawn numbers may exceed the cards' number range."""
+    cards = [BingoCard(4, 20) for _ in range(3)]
+    #Drawing every number of the cards first, plus numbers far outside their range.
+    draws = [500] + [n for card in cards for n in card.get_card_numbers()] + [10 ** 6]
+    first_line, bingo = resolve_win_rounds(draws, (card for card in cards))
+    #Failing the test if the generator was not read, or the rounds are wrong.
+    assert len(bingo) == 3
+    assert bingo[0] == 17 and 0 < first_line[0] <= 17
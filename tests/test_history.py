@@ -0,0 +1,166 @@
+import json
+import time
+import pytest
+from src.game.engine import play_game
+from src.ui.display import History
+
+#Defining a test function to verify that finished games are journaled and reloaded.
+def test_history_journal_round_trip(tmp_path):
+    """Games written to the journal must be counted again by History.load()."""
+    #Creating a history stored in a temporary directory, flushing every 2 games.
+    history = History(directory=tmp_path, flush_every=2)
+    #Recording three games (one win, two losses).
+    history.update_history(True, play_game(99))
+    history.update_history(False)
+    history.update_history(False)
+    #Failing the test if only the full batch reached the journal.
+    assert len((tmp_path / "history.jsonl").read_text().splitlines()) == 2
+    #Writing the remaining buffered game.
+    history.flush()
+    #Loading the history back from disk.
+    loaded = History.load(directory=tmp_path)
+    #Failing the test if the counts differ from the original.
+    assert (loaded.games_played, loaded.wins, loaded.losses) == (3, 1, 2)
+
+#Defining a test function to verify that compaction keeps the counts and empties the journal.
+def test_history_compaction(tmp_path):
+    """After compaction the snapshot holds the counts and the journal is empty."""
+    #Creating a history that compacts after 4 journaled games.
+    history = History(directory=tmp_path, flush_every=1, compact_every=4)
+    #Recording five games.
+    for win in (True, False, True, True, False):
+        history.update_history(win)
+    #Failing the test if the journal was not compacted down to the last game.
+    assert len((tmp_path / "history.jsonl").read_text().splitlines()) == 1
+    snapshot = json.loads((tmp_path / "history.json").read_text())
+    assert snapshot["games_played"] == 4 and snapshot["journal_offset"] == 0
+    #Failing the test if loading does not combine the snapshot and the journal.
+    loaded = History.load(directory=tmp_path)
+    assert (loaded.games_played, loaded.wins, loaded.losses) == (5, 3, 2)
+
+#Defining a test function to verify that a crash during compaction does not count games twice.
+def test_history_load_skips_compacted_journal(tmp_path):
+    """A snapshot that already covers the journal must not be added to it again."""
+    #Recording two games and simulating a crash right after the snapshot was written.
+    history = History(directory=tmp_path, flush_every=1)
+    history.update_history(True)
+    history.update_history(False)
+    history._write_snapshot((tmp_path / "history.jsonl").stat().st_size)
+    #Failing the test if the journaled games are counted twice.
+    assert History.load(directory=tmp_path).games_played == 2
+
+#Defining a test function to verify that compaction does not block recording games while it writes.
+def test_history_compaction_writes_without_game_lock(tmp_path):
+    """compact() must release the lock used by update_history() before writing the journal and the snapshot."""
+    history = History(directory=tmp_path, flush_every=100)
+    history.update_history(True)
+    #Recording whether the game lock is held during every write.
+    held = []
+    write, write_snapshot = history._write, history._write_snapshot
+    history._write = lambda batch: (held.append(history._lock.locked()), write(batch))
+    history._write_snapshot = lambda *args: (held.append(history._lock.locked()), write_snapshot(*args))
+    history.compact()
+    #Failing the test if a write happened under the lock, or the buffered game was lost.
+    assert held and not any(held)
+    assert History.load(directory=tmp_path).games_played == 1
+
+#Defining a test function to verify that a crash after the journal was emptied does not lose later games.
+def test_history_load_persists_offset_reset(tmp_path):
+    """A snapshot offset left past the end of an emptied journal must be reset on disk by load()."""
+    #Recording two games and simulating a crash between the journal truncation and the offset reset.
+    history = History(directory=tmp_path, flush_every=1)
+    history.update_history(True)
+    history.update_history(False)
+    history._write_snapshot((tmp_path / "history.jsonl").stat().st_size)
+    (tmp_path / "history.jsonl").write_text("")
+    #Loading once, then recording more games than the stale offset covered in a session that never compacts.
+    later = History.load(directory=tmp_path, flush_every=1)
+    for _ in range(5):
+        later.update_history(True)
+    #Failing the test if the later games are skipped on the next load.
+    assert History.load(directory=tmp_path).games_played == 7
+
+#Defining a test function to verify that the legacy snapshot format still loads.
+def test_history_loads_legacy_snapshot(tmp_path):
+    """A history.json written by older versions (counts only) must still load."""
+    #Writing a snapshot in the old format.
+    (tmp_path / "history.json").write_text(json.dumps({"games_played": 1, "wins": 0, "losses": 1}))
+    #Failing the test if the counts are not restored.
+    assert History.load(directory=tmp_path).losses == 1
+
+#Defining a test function to verify the SQLite backend keeps totals and per-mode aggregates.
+def test_sqlite_history_aggregates(tmp_path):
+    """Games written to SQLite must be reloaded and summarized per mode from the aggregate table."""
+    #Creating a history stored in a SQLite database, flushing every 3 games.
+    history = History(directory=tmp_path, backend="sqlite", flush_every=3)
+    #Recording two Easy games (always won) and one Competitive game (always lost).
+    history.update_history(True, play_game(99))
+    history.update_history(True, play_game(99))
+    history.update_history(False, play_game(30))
+    #Loading the history back from the database.
+    loaded = History.load(directory=tmp_path, backend="sqlite")
+    #Failing the test if the totals differ.
+    assert (loaded.games_played, loaded.wins, loaded.losses) == (3, 2, 1)
+    #Failing the test if the per-mode games and wins are wrong.
+    assert loaded.mode_games == {"Easy": 2, "Competitive": 1}
+    assert loaded.rounds_to_bingo["Easy"].count == 2
+    assert loaded.rounds_to_bingo["Competitive"].count == 0
+    #Failing the test if the average bingo round is outside the possible range.
+    assert 16 <= loaded.rounds_to_bingo["Easy"].mean <= 99
+
+#Defining a test function to verify the background writer batches games and flushes them on close.
+def test_write_behind_flushes_in_background(tmp_path):
+    """In write-behind mode, games are written by the background thread, and close() writes the rest."""
+    #Creating a write-behind history with a short interval.
+    history = History(directory=tmp_path, write_behind=True, flush_interval=0.01, flush_every=1)
+    #Recording a game and waiting for the background thread to write it.
+    history.update_history(True)
+    for _ in range(200):
+        if (tmp_path / "history.jsonl").exists():
+            break
+        time.sleep(0.01)
+    #Failing the test if the game was not written by the thread.
+    assert (tmp_path / "history.jsonl").read_text().count("\n") == 1
+    #Recording more games and closing right away.
+    history.update_history(False)
+    history.update_history(False)
+    history.close()
+    #Failing the test if the final flush lost a game.
+    assert History.load(directory=tmp_path).games_played == 3
+
+#Defining a test function to verify the per-mode round statistics survive a reload with both backends.
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_history_round_stats_round_trip(tmp_path, backend):
+    """The rounds-to-bingo statistics must be the same after compaction or a database reload."""
+    #Recording five Easy games (always won) and compacting them into the snapshot.
+    history = History(directory=tmp_path, backend=backend, flush_every=1)
+    results = [play_game(99) for _ in range(5)]
+    for result in results:
+        history.update_history(True, result)
+    history.save()
+    #Loading the history back.
+    loaded = History.load(directory=tmp_path, backend=backend)
+    #Failing the test if the statistics differ from the recorded bingo rounds.
+    stats = loaded.rounds_to_bingo["Easy"]
+    assert loaded.mode_games["Easy"] == 5 and stats.count == 5
+    assert stats.mean == pytest.approx(sum(r.bingo_round for r in results) / 5)
+    assert loaded.rounds_to_line["Easy"].count == 5
+    #Failing the test if merging two histories does not add their statistics.
+    merged = History(directory=tmp_path / "merged").merge(loaded).merge(loaded)
+    assert merged.games_played == 10 and merged.rounds_to_bingo["Easy"].count == 10
+    history.close()
+    loaded.close()
+
+#Defining a test function to verify that games without a result only count in the totals, with both backends.
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_history_games_without_mode(tmp_path, backend):
+    """A game recorded without its result must not show up as a mode after a reload."""
+    history = History(directory=tmp_path, backend=backend, flush_every=1)
+    history.update_history(False)
+    history.update_history(True, play_game(99))
+    history.close()
+    loaded = History.load(directory=tmp_path, backend=backend)
+    #Failing the test if the totals or the modes differ between the backends.
+    assert (loaded.games_played, loaded.wins, loaded.losses) == (2, 1, 1)
+    assert loaded.mode_games == {"Easy": 1}
+    loaded.close()
@@ -22,3 +22,17 @@ def test_mode_selection():
         assert len(game.drawer.drawn_numbers) == expected_rounds
         #Failing the test if the numbers drawn are not all unique (there are duplicates). 
         assert len(set(game.drawer.drawn_numbers)) == expected_rounds
+
+#Defining a test function to verify that the console menu offers exactly the shared game modes.
+def test_mode_menu_matches_game_modes(capsys):
+    from src.game.engine import GAME_MODES
+    #Choosing every mode in turn and checking the rounds it sets.
+    for number, (name, rounds) in enumerate(GAME_MODES, 1):
+        game = MiniBingo()
+        with patch("builtins.input", return_value=str(number)):
+            game.choose_mode()
+        assert game.rounds == rounds
+    #Failing the test if the menu shows rounds that differ from the shared table.
+    menu = capsys.readouterr().out
+    for number, (name, rounds) in enumerate(GAME_MODES, 1):
+        assert f"{number}. {name} ({rounds} rounds)" in menu
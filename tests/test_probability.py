@@ -0,0 +1,35 @@
+import pytest
+from fractions import Fraction
+from itertools import combinations
+from src.game.probability import bingo_probability, line_probability, probability_table
+
+#Defining a test function to compare the formulas with a full enumeration on a tiny game.
+def test_probabilities_match_enumeration():
+    """On a 2x2 card with numbers 1-6, the formulas must match counting every possible draw set."""
+    #Using the card [[1, 2], [3, 4]]; any card gives the same odds.
+    lines = [{1, 2}, {3, 4}, {1, 3}, {2, 4}]
+    #Creating a loop over every number of rounds.
+    for k in range(1, 7):
+        #Listing every possible set of drawn numbers after k rounds.
+        draw_sets = [set(c) for c in combinations(range(1, 7), k)]
+        #Counting the draw sets that complete a line and the ones that complete the card.
+        with_line = sum(any(line <= drawn for line in lines) for drawn in draw_sets)
+        with_bingo = sum({1, 2, 3, 4} <= drawn for drawn in draw_sets)
+        #Failing the test if the formulas disagree with the enumeration.
+        assert line_probability(k, size=2, number_range=6) == Fraction(with_line, len(draw_sets))
+        assert bingo_probability(k, size=2, number_range=6) == Fraction(with_bingo, len(draw_sets))
+
+#Defining a test function to verify the table covers every round with sensible values.
+def test_probability_table_bounds():
+    """The table must cover 1..99, grow with the rounds, and end at certainty."""
+    #Building the table for the standard 4x4 card on 1-99.
+    table = probability_table()
+    #Failing the test if some round is missing.
+    assert [k for k, _, _ in table] == list(range(1, 100))
+    #Failing the test if a line is possible before 4 draws, or a bingo before 16.
+    assert table[2][1] == 0 and table[14][2] == 0
+    #Failing the test if the probabilities ever decrease, or a bingo is likelier than a line.
+    for (_, line1, bingo1), (_, line2, bingo2) in zip(table, table[1:]):
+        assert line1 <= line2 and bingo1 <= bingo2 and bingo2 <= line2
+    #Failing the test if drawing every number does not guarantee both.
+    assert table[-1][1:] == (1, 1)
@@ -0,0 +1,39 @@
+import pytest
+from src.game.card import BingoCard
+from src.game.engine import win_rounds
+from src.game.simulate import simulate
+
+#Defining a test function to verify the draw-order shortcut used by the simulator.
+def test_win_rounds_matches_draw_order():
+    """win_rounds() should find the first line and bingo rounds from the draw order alone."""
+    #Creating a card and a draw order that draws the first row first, then the rest of the card.
+    card = BingoCard()
+    draws = card.grid[0] + [n for row in card.grid[1:] for n in row]
+    #Failing the test if the first row is not complete after 4 draws, or the card after 16.
+    assert win_rounds(card, draws) == (4, 16)
+    #Failing the test if a card with undrawn numbers is reported as complete.
+    assert win_rounds(card, draws[:10]) == (4, None)
+
+#Defining a test function to verify the simulated rates are consistent with the rules.
+def test_simulation_rates_are_consistent():
+    """Easy mode (every number drawn) must always win; shorter modes can never do better."""
+    #Running a small single-process simulation.
+    report = simulate(300, workers=1, seed=1)
+    easy, normal, competitive = report.modes["Easy"], report.modes["Normal"], report.modes["Competitive"]
+    #Failing the test if Easy mode is not always won.
+    assert easy.win_rate == 1.0 and easy.first_line_rate == 1.0
+    #Failing the test if a shorter mode has better odds than a longer one.
+    assert competitive.win_rate <= normal.win_rate <= easy.win_rate
+    assert competitive.first_line_rate <= normal.first_line_rate
+    #Failing the test if the histogram does not account for every game.
+    assert sum(report.bingo_rounds) == 300
+
+#Defining a test function to verify that a seeded simulation does not depend on the worker count.
+def test_seeded_simulation_independent_of_workers():
+    """The same seed must give the same histograms with one worker or a process pool."""
+    #Running the same seeded simulation inline and on two worker processes.
+    inline = simulate(400, workers=1, seed=9, batch_size=100)
+    pooled = simulate(400, workers=2, seed=9, batch_size=100)
+    #Failing the test if the results differ.
+    assert inline.bingo_rounds == pooled.bingo_rounds
+    assert inline.first_line_rounds == pooled.first_line_rounds
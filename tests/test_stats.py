@@ -0,0 +1,36 @@
+import random
+import statistics
+import pytest
+from src.game.stats import RoundStats
+
+#Defining a test function to verify the streaming mean, variance and percentiles.
+def test_round_stats_match_statistics_module():
+    """RoundStats must agree with the statistics module on the same rounds."""
+    #Recording 500 random rounds.
+    rng = random.Random(3)
+    values = [rng.randint(1, 99) for _ in range(500)]
+    stats = RoundStats()
+    for value in values:
+        stats.add(value)
+    #Failing the test if the count, mean or standard deviation differ.
+    assert stats.count == 500
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.stdev == pytest.approx(statistics.stdev(values))
+    #Failing the test if the median differs from the sorted values.
+    assert stats.percentile(50) == sorted(values)[249]
+
+#Defining a test function to verify that summaries from different workers merge exactly.
+def test_round_stats_merge():
+    """Merging two summaries must give the same result as recording every value in one."""
+    #Splitting the same rounds between two summaries and one combined summary.
+    left, right, combined = RoundStats(), RoundStats(), RoundStats()
+    for value in range(1, 60):
+        (left if value % 3 else right).add(value)
+        combined.add(value)
+    left.merge(right)
+    #Failing the test if the merged summary differs from the combined one.
+    assert left.histogram == combined.histogram and left.count == combined.count
+    assert left.mean == pytest.approx(combined.mean) and left.m2 == pytest.approx(combined.m2)
+    #Failing the test if rebuilding from the histogram loses the mean or variance.
+    rebuilt = RoundStats.from_histogram(combined.histogram)
+    assert rebuilt.mean == pytest.approx(combined.mean) and rebuilt.variance == pytest.approx(combined.variance)
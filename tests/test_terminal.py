@@ -0,0 +1,39 @@
+import pytest
+from src.ui import terminal
+from src.ui.terminal import CursesBingo
+
+#Defining a fake curses window that records every write.
+class FakeWindow:
+    def __init__(self, height=40, width=120):
+        self.size = (height, width)
+        self.writes = []
+        self.refreshes = 0
+    def getmaxyx(self):
+        return self.size
+    def addstr(self, y, x, text, attr=0):
+        self.writes.append((y, x, text))
+    def noutrefresh(self):
+        self.refreshes += 1
+    def box(self): pass
+    def erase(self): pass
+    def timeout(self, ms): pass
+
+#Defining a test function to verify that a draw only rewrites and refreshes the windows it changed.
+def test_curses_draw_refreshes_changed_windows(monkeypatch):
+    """A draw that misses the card must not touch the card window, and one that hits rewrites one cell."""
+    #Replacing the curses screen functions with fake windows.
+    monkeypatch.setattr(terminal.curses, "newwin", lambda *args: FakeWindow())
+    monkeypatch.setattr(terminal.curses, "doupdate", lambda: None)
+    ui = CursesBingo(FakeWindow(), rounds=99)
+    ui.new_game()
+    #Playing every round, checking the card window after each draw.
+    while True:
+        before = (len(ui.card_win.writes), ui.card_win.refreshes)
+        outcome = ui.draw()
+        if outcome is None:
+            break
+        expected = (before[0] + 1, before[1] + 1) if outcome.marked else before
+        #Failing the test if the card window changed more than the marked cell.
+        assert (len(ui.card_win.writes), ui.card_win.refreshes) == expected
+    #Failing the test if the game did not end with a bingo (Easy mode draws every number).
+    assert ui.engine.result().won
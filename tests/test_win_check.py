@@ -98,3 +98,90 @@ def test_check_line_diagonal_not_valid():
         card.marked[i][i] = True
     #Failing if the diagonal numbers marked are recognized as winning lines. 
     assert card.check_line() == False
+
+#Defining a test function to verify that mark_number() keeps the row, column and total counters up to date.
+def test_mark_number_updates_counters():
+    """Marking a number should increment its row, column and total counters once."""
+    #Creating a new bingo card instance.
+    card = BingoCard()
+    #Marking the number in the second row, third column twice (the second call must not count again).
+    card.mark_number(card.grid[1][2])
+    card.mark_number(card.grid[1][2])
+    #Failing the test if the counters do not reflect exactly one marked cell.
+    assert card.row_counts == [0, 1, 0, 0]
+    assert card.col_counts == [0, 0, 1, 0]
+    assert card.marked_count == 1
+
+#Defining a test function to verify that a line drawn through mark_number() is announced only once.
+def test_check_line_announces_once_via_mark_number():
+    """A row completed by drawing its numbers is reported by exactly one check_line() call."""
+    #Creating a new bingo card instance.
+    card = BingoCard()
+    #Marking every number of the third row.
+    for number in card.grid[2]:
+        card.mark_number(number)
+    #Failing the test if the line is not reported the first time, or reported again afterwards.
+    assert card.check_line() == True
+    assert card.check_line() == False
+    #Failing the test if the row is not recorded as announced.
+    assert card.line_rows_announced[2]
+
+#Defining a test function to verify that marking every number triggers bingo.
+def test_check_bingo_via_mark_number():
+    """Drawing every number on the card should complete the bingo."""
+    #Creating a new bingo card instance.
+    card = BingoCard()
+    #Marking every number on the card except the last one.
+    numbers = card.get_card_numbers()
+    for number in numbers[:-1]:
+        card.mark_number(number)
+    #Failing the test if bingo is detected one number early.
+    assert card.check_bingo() == False
+    #Marking the last number.
+    card.mark_number(numbers[-1])
+    #Failing the test if bingo is not detected.
+    assert card.check_bingo() == True
+
+#Defining a test function to verify the events returned by mark().
+def test_mark_returns_events():
+    """mark() reports the cell, the lines completed by each mark, and the bingo exactly once."""
+    #Creating a new bingo card instance.
+    card = BingoCard()
+    #Failing the test if a number off the card is reported as marked.
+    assert not card.mark(999).marked
+    #Marking every number of the card, row by row, and collecting the events.
+    events = [card.mark(number) for number in card.get_card_numbers()]
+    #Failing the test if the cells do not follow the grid.
+    assert [event.cell for event in events[:2]] == [(0, 0), (0, 1)]
+    #Failing the test if each row end does not complete its row (the last cell also completes the last column).
+    assert [event.new_lines for event in events[3::4]] == [1, 1, 1, 2]
+    #Failing the test if the lines of all the events do not add up to every row and column.
+    assert sum(event.new_lines for event in events) == 2 * card.size
+    #Failing the test if the bingo is not reported by the last mark only.
+    assert [event.bingo for event in events].count(True) == 1 and events[-1].bingo
+    #Failing the test if marking a number again reports anything new.
+    again = card.mark(card.grid[0][0])
+    assert again.marked and again.new_lines == 0 and not again.bingo
+
+#Defining a test function to verify that the marked matrix cannot be resized behind the counters' back.
+@pytest.mark.parametrize("change", [
+    lambda m: m.append([False] * 4), lambda m: m[0].append(True), lambda m: m[0].extend([True]),
+    lambda m: m[0].insert(0, True), lambda m: m[1].clear(), lambda m: m[0].pop(), lambda m: m.__delitem__(0),
+    lambda m: m[0].__setitem__(slice(0, 2), [True]),
+])
+def test_marked_matrix_has_fixed_size(change):
+    """Methods that would change the size of the marked rows or matrix must raise instead of going stale."""
+    card = BingoCard()
+    with pytest.raises(TypeError):
+        change(card.marked)
+    #Failing the test if the failed change altered the card.
+    assert [len(row) for row in card.marked] == [4] * 4 and card.marked_count == 0
+
+#Defining a test function to verify that slice assignments of the same size keep the counters in sync.
+def test_marked_slice_assignment_recounts():
+    """Assigning whole slices of cells or rows must update the line and bingo checks."""
+    card = BingoCard()
+    card.marked[0][:] = [True] * 4
+    assert card.check_line()
+    card.marked[1:] = [[True] * 4] * 3
+    assert card.check_bingo() and card.marked_count == 16